@@ -18,15 +18,78 @@ FF  – Free Float   : how much an activity can slip without delaying any *succe
 
 from __future__ import annotations
 
-import json
+import re
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from activity_arrays import ActivityArrays
+
+__all__ = ["Activity"]
+
+# Serialised field order shared by ``to_dict`` and the bulk exporters.
+_ACTIVITY_KEYS: Tuple[str, ...] = (
+    "id", "name", "duration", "predecessors", "resource", "description",
+    "ES", "EF", "LS", "LF", "total_float", "free_float", "is_critical",
+)
+
+
+@lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """Return the optional ``orjson`` module, or ``None`` (imported on first use)."""
+    try:
+        import orjson
+    except ImportError:  # orjson is an optional accelerator
+        return None
+    return orjson
+
+
+def _dumps(obj: Any, **kwargs) -> str:
+    """
+    Encode *obj* as JSON text.
+
+    Uses orjson's C encoder when it is installed and no ``json.dumps``
+    options were requested; otherwise falls back to the stdlib encoder so
+    options such as ``indent`` keep working.  Without options the fallback
+    emits the same compact, non-ASCII-escaped text orjson does.
+    """
+    if not kwargs:
+        if _orjson() is not None:
+            return _orjson().dumps(obj).decode()
+        kwargs = {"separators": (",", ":"), "ensure_ascii": False}
+    import json     # deferred: JSON is rarely used while scheduling
+
+    return json.dumps(obj, **kwargs)
+
+
+# Pre-rendered ``summary()`` tags for the common small total floats.
+_FLOAT_TAGS: Tuple[str, ...] = tuple(f"[float={tf:>3}]" for tf in range(256))
 
 
 # ---------------------------------------------------------------------------
 # Helper utilities
 # ---------------------------------------------------------------------------
 
+# One predecessor ID: no commas, no leading/trailing whitespace (inner spaces kept).
+_PRED_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+@lru_cache(maxsize=8192)
+def _parse_predecessors_str(value: str) -> Tuple[str, ...]:
+    """
+    Split a comma‑separated predecessor string into a tuple of stripped IDs.
+
+    Cached on the raw string: re‑imports repeat the same specs many times, and
+    every activity with an identical spec shares one immutable tuple.  IDs are
+    interned so they are the same objects as the interned ``Activity.id`` keys.
+    Repeated IDs are dropped (first occurrence kept): each predecessor is one
+    row of the ``predecessor_links`` table.
+    """
+    return tuple(dict.fromkeys(map(sys.intern, _PRED_RE.findall(value))))
+
+
 def _parse_predecessors(value: Any) -> Tuple[str, ...]:
     """
     Normalise a predecessor specification into a tuple of activity‑ID strings.
@@ -36,17 +99,17 @@ def _parse_predecessors(value: Any) -> Tuple[str, ...]:
         - A comma‑separated string:          ``"A, B"``
         - An empty string / None:            ``""`` / ``None``
 
-    Returns a tuple of stripped, non‑empty strings.
+    Returns a tuple of stripped, non‑empty, distinct strings (first-seen order).
     """
-    if value is None:
+    if not value:
         return ()
+    if isinstance(value, str):
+        return _parse_predecessors_str(value)
     if isinstance(value, (list, tuple)):
         # Normalise each element and filter out empties
-        return tuple(p.strip() for p in value if isinstance(p, str) and p.strip())
-    if isinstance(value, str):
-        # Split on commas and normalise
-        parts = [p.strip() for p in value.split(",") if p.strip()]
-        return tuple(parts)
+        return tuple(dict.fromkeys(
+            sys.intern(p.strip()) for p in value if isinstance(p, str) and p.strip()
+        ))
     raise TypeError(
         f"predecessors must be a list, tuple, or comma‑separated string, got {type(value)}"
     )
@@ -56,7 +119,7 @@ def _parse_predecessors(value: Any) -> Tuple[str, ...]:
 # Main dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass(slots=True)          # <-- reduces memory overhead
+@dataclass(slots=True, eq=False)    # slots: no per-instance __dict__; eq: see __eq__ below
 class Activity:
     """
     Represents a single CPM project activity.
@@ -117,8 +180,9 @@ class Activity:
 
     def __post_init__(self) -> None:
         """Validate inputs and normalise predecessors after construction."""
-        # Normalise id and name
-        self.id = self.id.strip()
+        # Normalise id and name.  The id is interned: it is the dict key used
+        # throughout the scheduler and UI, so lookups hit the pointer fast path.
+        self.id = sys.intern(self.id.strip())
         if not self.id:
             raise ValueError("Activity 'id' must be a non‑empty string.")
 
@@ -143,6 +207,16 @@ class Activity:
                     f"Each predecessor must be a non‑empty string, got {p!r}."
                 )
 
+        # Intern predecessor IDs; tuples from the cached parser already are,
+        # so they are kept (and shared) as-is.
+        if any(p is not sys.intern(p) for p in self.predecessors):
+            self.predecessors = tuple(sys.intern(p) for p in self.predecessors)
+
+        # Drop repeated predecessors, keeping first-seen order: the link table
+        # is keyed on (activity_id, pred_id), so each may appear only once.
+        if len(set(self.predecessors)) != len(self.predecessors):
+            self.predecessors = tuple(dict.fromkeys(self.predecessors))
+
         # Guard against self‑loop
         if self.id in self.predecessors:
             raise ValueError(
@@ -212,25 +286,25 @@ class Activity:
         The ``predecessors`` tuple is stored as a comma‑separated string so
         the dict can be written directly to CSV / Excel rows.
         """
-        return {
-            "id": self.id,
-            "name": self.name,
-            "duration": self.duration,
-            "predecessors": ",".join(self.predecessors),
-            "resource": self.resource or "",
-            "description": self.description or "",
-            "ES": self.ES,
-            "EF": self.EF,
-            "LS": self.LS,
-            "LF": self.LF,
-            "total_float": self.total_float,
-            "free_float": self.free_float,
-            "is_critical": self.is_critical,
-        }
+        return dict(zip(_ACTIVITY_KEYS, (
+            self.id,
+            self.name,
+            self.duration,
+            ",".join(self.predecessors),
+            self.resource or "",
+            self.description or "",
+            self.ES,
+            self.EF,
+            self.LS,
+            self.LF,
+            self.total_float,
+            self.free_float,
+            self.is_critical,
+        )))
 
     def to_json(self, **kwargs) -> str:
         """Return the activity serialised as a JSON string."""
-        return json.dumps(self.to_dict(), **kwargs)
+        return _dumps(self.to_dict(), **kwargs)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Activity":
@@ -259,9 +333,24 @@ class Activity:
             is_critical=bool(data.get("is_critical", False)),
         )
 
+    @classmethod
+    def from_records(cls, rows: List[Dict[str, Any]]) -> "ActivityArrays":
+        """
+        Bulk-convert many dict rows into a column-wise `ActivityArrays` table.
+
+        Much cheaper than ``from_dict`` per row for large imports: numeric
+        fields are converted per column and validation runs once over the
+        batch (see ``ActivityArrays.from_records``).
+        """
+        from activity_arrays import ActivityArrays
+
+        return ActivityArrays.from_records(rows)
+
     @classmethod
     def from_json(cls, json_str: str) -> "Activity":
         """Deserialise an Activity from a JSON string."""
+        import json
+
         return cls.from_dict(json.loads(json_str))
 
     # ------------------------------------------------------------------ #
@@ -276,13 +365,19 @@ class Activity:
 
             [CRITICAL] A | Foundation Work | dur=5 | ES=0 EF=5 LS=0 LF=5 | TF=0 FF=0
         """
-        tag = "[CRITICAL]" if self.is_critical else "[float={:>3}]".format(self.total_float)
-        preds_str = ",".join(self.predecessors) if self.predecessors else "—"
+        tf = self.total_float
+        if self.is_critical:
+            tag = "[CRITICAL]"
+        elif 0 <= tf < 256:
+            tag = _FLOAT_TAGS[tf]
+        else:
+            tag = f"[float={tf:>3}]"
+        preds_str = ",".join(self.predecessors) or "—"
         return (
             f"{tag} {self.id} | {self.name} | dur={self.duration} | "
             f"pred=[{preds_str}] | "
             f"ES={self.ES} EF={self.EF} LS={self.LS} LF={self.LF} | "
-            f"TF={self.total_float} FF={self.free_float}"
+            f"TF={tf} FF={self.free_float}"
         )
 
     def __repr__(self) -> str:
@@ -292,10 +387,16 @@ class Activity:
         )
 
     def __eq__(self, other: object) -> bool:
-        """Two activities are considered equal if they share the same ``id``."""
+        """
+        Two activities are considered equal if they share the same ``id``.
+
+        Ids are interned in ``__post_init__``, so matching ids are normally the
+        same object and the ``is`` check settles the comparison without a
+        string compare; ``==`` remains as the fallback for ids assigned later.
+        """
         if not isinstance(other, Activity):
             return NotImplemented
-        return self.id == other.id
+        return self.id is other.id or self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return hash(self.id)     # str caches its own hash
@@ -0,0 +1,481 @@
+"""
+Structure-of-Arrays activity store for Mini-P7.
+
+`Activity` objects are convenient for the UI layer, but they force the CPM
+passes to walk Python objects one attribute at a time.  `ActivityArrays`
+keeps the same data column-wise in parallel ``np.int32`` arrays so that the
+scheduling arithmetic runs as single vectorised operations:
+
+    EF = ES + duration        → compute_ef_all()
+    LS = LF - duration        → compute_ls_all()
+    TF = LS - ES, TF == 0     → compute_floats_all()
+
+``run_cpm()`` runs the full forward / backward pass over the table using the
+compiled kernels in cpm_kernels.py.
+
+Predecessors are stored in CSR (compressed sparse row) form, built once from
+the string IDs via the ``id → row`` index::
+
+    pred_idx[pred_off[i]:pred_off[i + 1]]   → row indices of row i's predecessors
+
+`Activity` objects are only materialised again (``to_activities``) for the
+UI / persistence layers; bulk exports go straight from the columns
+(``to_dataframe`` / ``to_json_array``).
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+import cpm_kernels
+from activity import _ACTIVITY_KEYS, Activity, _dumps, _parse_predecessors
+
+
+_INITIAL_CAPACITY = 16
+
+# Integer columns, in the same order as the CPM fields on `Activity`.
+_INT_COLUMNS = ("duration", "ES", "EF", "LS", "LF", "total_float", "free_float")
+
+
+def _csr_rows(off: np.ndarray, idx: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather the CSR entries of *rows* in one vectorised step.
+
+    Returns ``(values, starts)``: the concatenated ``idx[off[r]:off[r + 1]]``
+    slices and the offset of each row's segment within ``values`` (the
+    layout ``np.ufunc.reduceat`` expects).
+    """
+    first = off[rows]
+    counts = off[rows + 1] - first
+    starts = np.cumsum(counts) - counts
+    pos = np.arange(int(counts.sum())) + np.repeat(first - starts, counts)
+    return idx[pos], starts
+
+
+def _column(name: str) -> property:
+    """Return a property exposing the live ``[:size]`` view of a column buffer."""
+
+    def getter(self: "ActivityArrays") -> np.ndarray:
+        return self._buf[name][: self._size]
+
+    return property(getter, doc=f"``{name}`` column (view over the first ``len(self)`` rows).")
+
+
+class ActivityArrays:
+    """
+    Column-oriented (SoA) table of CPM activities.
+
+    Columns are grown by doubling, like ``std::vector``, so appending N
+    activities costs amortised O(1) per row.  All column properties return
+    *views*, so in-place NumPy operations (``out=...``) write straight into
+    the table.
+    """
+
+    duration    = _column("duration")
+    ES          = _column("ES")
+    EF          = _column("EF")
+    LS          = _column("LS")
+    LF          = _column("LF")
+    total_float = _column("total_float")
+    free_float  = _column("free_float")
+    is_critical = _column("is_critical")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        capacity = max(int(capacity), 1)
+        self._size = 0
+        self._buf: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=np.int32) for name in _INT_COLUMNS
+        }
+        self._buf["is_critical"] = np.zeros(capacity, dtype=np.bool_)
+
+        # Non-numeric columns stay as plain Python lists.
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._preds_py: List[Tuple[str, ...]] = []
+        self._resources: List[Optional[str]] = []
+        self._descriptions: List[Optional[str]] = []
+        self._id2i: Dict[str, int] = {}
+
+        # CSR predecessor arrays (built lazily by build_csr / build_pred_csr)
+        self.pred_idx = np.zeros(0, dtype=np.int32)
+        self.pred_off = np.zeros(1, dtype=np.int32)
+        self.succ_idx = np.zeros(0, dtype=np.int32)
+        self.succ_off = np.zeros(1, dtype=np.int32)
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                        #
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_activities(cls, activities: Iterable[Activity]) -> "ActivityArrays":
+        """Build a table from an iterable of `Activity` objects."""
+        acts = list(activities)
+        table = cls(capacity=len(acts))
+        for act in acts:
+            table.add(act)
+        return table
+
+    @classmethod
+    def from_records(cls, rows: Sequence[Dict[str, Any]]) -> "ActivityArrays":
+        """
+        Bulk-build a table from dict rows (e.g. CSV / JSON records).
+
+        Numeric fields are converted column-at-a-time with ``np.fromiter``
+        and no per-row `Activity` is constructed.  Validation runs once over
+        the whole batch: empty ids/names, negative durations, duplicate ids,
+        unknown predecessors and self-loops all raise ``ValueError``.
+        """
+        n = len(rows)
+        table = cls(capacity=n)
+        buf = table._buf
+
+        buf["duration"][:n] = np.fromiter(
+            (int(r["duration"]) for r in rows), dtype=np.int32, count=n
+        )
+        for name in _INT_COLUMNS[1:]:
+            buf[name][:n] = np.fromiter(
+                (int(r.get(name, 0)) for r in rows), dtype=np.int32, count=n
+            )
+        buf["is_critical"][:n] = np.fromiter(
+            (bool(r.get("is_critical", False)) for r in rows), dtype=np.bool_, count=n
+        )
+
+        table._ids = [sys.intern(str(r["id"]).strip()) for r in rows]
+        table._names = [str(r["name"]).strip() for r in rows]
+        table._preds_py = [_parse_predecessors(r.get("predecessors", "")) for r in rows]
+        table._resources = [r.get("resource") or None for r in rows]
+        table._descriptions = [r.get("description") or None for r in rows]
+        table._id2i = {act_id: i for i, act_id in enumerate(table._ids)}
+        table._size = n
+
+        # ---- Aggregate validation ----
+        if not all(table._ids):
+            raise ValueError("Activity 'id' must be a non‑empty string.")
+        if not all(table._names):
+            raise ValueError("Activity 'name' must be a non‑empty string.")
+        if (table.duration < 0).any():
+            bad = table._ids[int(np.argmax(table.duration < 0))]
+            raise ValueError(f"Activity '{bad}' has a negative duration.")
+        if len(table._id2i) != n:
+            dupes = sorted(i for i, c in Counter(table._ids).items() if c > 1)
+            raise ValueError(f"Duplicate activity id(s): {', '.join(dupes)}")
+
+        table.build_pred_csr()      # raises on unknown predecessors
+        owners = np.repeat(np.arange(n, dtype=np.int32), np.diff(table.pred_off))
+        loops = owners[table.pred_idx == owners]
+        if loops.size:
+            raise ValueError(
+                f"Activity '{table._ids[int(loops[0])]}' lists itself as a predecessor."
+            )
+        return table
+
+    def add(self, activity: Activity) -> int:
+        """Append *activity* as a new row and return its row index."""
+        if activity.id in self._id2i:
+            raise ValueError(f"Duplicate activity id '{activity.id}'.")
+
+        if self._size == len(self._buf["duration"]):
+            self._grow()
+
+        i = self._size
+        buf = self._buf
+        buf["duration"][i]    = activity.duration
+        buf["ES"][i]          = activity.ES
+        buf["EF"][i]          = activity.EF
+        buf["LS"][i]          = activity.LS
+        buf["LF"][i]          = activity.LF
+        buf["total_float"][i] = activity.total_float
+        buf["free_float"][i]  = activity.free_float
+        buf["is_critical"][i] = activity.is_critical
+
+        self._ids.append(activity.id)
+        self._names.append(activity.name)
+        self._preds_py.append(activity.predecessors)
+        self._resources.append(activity.resource)
+        self._descriptions.append(activity.description)
+        self._id2i[activity.id] = i
+
+        self._size += 1
+        return i
+
+    def _grow(self) -> None:
+        """Double the capacity of every column buffer."""
+        new_cap = max(2 * len(self._buf["duration"]), _INITIAL_CAPACITY)
+        for name, old in self._buf.items():
+            new = np.zeros(new_cap, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            self._buf[name] = new
+
+    def build_pred_csr(self) -> None:
+        """
+        Translate every row's predecessor IDs into CSR ``pred_idx`` / ``pred_off``.
+
+        Raises
+        ------
+        ValueError
+            If a predecessor ID does not exist in the table.
+        """
+        id2i = self._id2i
+        counts = np.fromiter(
+            (len(p) for p in self._preds_py), dtype=np.int32, count=self._size
+        )
+        self.pred_off = np.zeros(self._size + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.pred_off[1:])
+
+        flat: List[int] = []
+        for i, plist in enumerate(self._preds_py):
+            for p in plist:
+                try:
+                    flat.append(id2i[p])
+                except KeyError:
+                    raise ValueError(
+                        f"Activity '{self._ids[i]}' references unknown predecessor '{p}'"
+                    ) from None
+        self.pred_idx = np.array(flat, dtype=np.int32)
+
+    def build_csr(self) -> None:
+        """
+        Build the predecessor and successor CSRs together in one pass.
+
+        Each predecessor ID is resolved once; the resulting edge is written to
+        the predecessor list of its row and appended to the successor bucket
+        of the predecessor row, so no second traversal or sort is needed.
+
+        Raises
+        ------
+        ValueError
+            If a predecessor ID does not exist in the table.
+        """
+        n = self._size
+        id2i = self._id2i
+        pred_flat: List[int] = []
+        succ_lists: List[List[int]] = [[] for _ in range(n)]
+        for i, plist in enumerate(self._preds_py):
+            for p in plist:
+                try:
+                    j = id2i[p]
+                except KeyError:
+                    raise ValueError(
+                        f"Activity '{self._ids[i]}' references unknown predecessor '{p}'"
+                    ) from None
+                pred_flat.append(j)
+                succ_lists[j].append(i)
+
+        self.pred_off = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(
+            np.fromiter((len(p) for p in self._preds_py), dtype=np.int32, count=n),
+            out=self.pred_off[1:],
+        )
+        self.pred_idx = np.array(pred_flat, dtype=np.int32)
+
+        self.succ_off = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(
+            np.fromiter((len(s) for s in succ_lists), dtype=np.int32, count=n),
+            out=self.succ_off[1:],
+        )
+        self.succ_idx = np.fromiter(
+            chain.from_iterable(succ_lists), dtype=np.int32, count=len(pred_flat)
+        )
+
+    def topological_order(self) -> np.ndarray:
+        """
+        Return row indices in topological order (Kahn's algorithm).
+
+        This is the flattened ``order`` of `topological_levels`, so ``run_cpm``
+        and the scheduler share one Kahn implementation.  Requires both CSRs.
+        Raises ``ValueError`` on a circular dependency.
+        """
+        return self.topological_levels()[0]
+
+    def topological_levels(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return rows grouped into dependency levels as ``(order, level_off)``.
+
+        Kahn's algorithm run one frontier at a time: every row in
+        ``order[level_off[k]:level_off[k + 1]]`` has all its predecessors in
+        earlier levels, so a whole level can be processed as one vectorised
+        step.  ``order`` is itself a valid topological order.
+
+        Requires both CSRs.  Raises ``ValueError`` on a circular dependency.
+        """
+        if cpm_kernels.HAVE_NUMBA:
+            n = self._size
+            order = np.empty(n, dtype=np.int32)
+            level_off = np.empty(n + 1, dtype=np.int32)
+            count, levels = cpm_kernels.topological_levels(
+                self.succ_idx, self.succ_off, np.diff(self.pred_off), order, level_off
+            )
+            if count != n:
+                raise ValueError("Circular dependency detected in activity network.")
+            return order, level_off[:levels + 1]
+
+        in_degree = np.diff(self.pred_off).tolist()
+        succ_idx = self.succ_idx.tolist()
+        succ_off = self.succ_off.tolist()
+
+        frontier = [i for i, deg in enumerate(in_degree) if deg == 0]
+        order: List[int] = []
+        level_off = [0]
+        while frontier:
+            order.extend(frontier)
+            level_off.append(len(order))
+            nxt: List[int] = []
+            for i in frontier:
+                for s in succ_idx[succ_off[i]:succ_off[i + 1]]:
+                    in_degree[s] -= 1
+                    if in_degree[s] == 0:
+                        nxt.append(s)
+            frontier = nxt
+
+        if len(order) != self._size:
+            raise ValueError("Circular dependency detected in activity network.")
+        order = np.array(order, dtype=np.int32)
+        level_off = np.array(level_off, dtype=np.int32)
+        return order, level_off
+
+    # ------------------------------------------------------------------ #
+    # Vectorised CPM helpers                                              #
+    # ------------------------------------------------------------------ #
+
+    def compute_ef_all(self) -> None:
+        """EF = ES + duration for every row."""
+        np.add(self.ES, self.duration, out=self.EF)
+
+    def compute_ls_all(self) -> None:
+        """LS = LF - duration for every row."""
+        np.subtract(self.LF, self.duration, out=self.LS)
+
+    def compute_floats_all(self) -> None:
+        """
+        Total float and critical flag for every row (free float is set by the scheduler).
+
+        Both results are written in place via ``out=`` — no temporaries and
+        no per-row branch; ``is_critical`` is a plain boolean mask.
+        """
+        np.subtract(self.LS, self.ES, out=self.total_float)
+        np.equal(self.total_float, 0, out=self.is_critical)
+
+    def run_cpm(self) -> int:
+        """
+        Run the full CPM over the table in place and return the project finish.
+
+        Builds the CSRs, sorts topologically, then runs the forward pass,
+        backward pass and float computation through the compiled kernels.
+        """
+        if not self._size:
+            return 0
+        self.build_csr()
+        order = self.topological_order()
+
+        cpm_kernels.forward_pass(
+            order, self.duration, self.ES, self.EF, self.pred_idx, self.pred_off
+        )
+        project_finish = int(self.EF.max())
+        cpm_kernels.backward_pass(
+            order, self.duration, self.ES, self.EF, self.LS, self.LF, self.free_float,
+            self.succ_idx, self.succ_off, project_finish,
+        )
+        self.compute_floats_all()
+        return project_finish
+
+    # ------------------------------------------------------------------ #
+    # Accessors                                                           #
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def ids(self) -> List[str]:
+        """Activity IDs in row order."""
+        return self._ids
+
+    def index_of(self, activity_id: str) -> int:
+        """Return the row index of *activity_id* (``KeyError`` if absent)."""
+        return self._id2i[activity_id]
+
+    def predecessors_of(self, i: int) -> Tuple[str, ...]:
+        """Predecessor IDs of row *i*, as the CSRs were built from."""
+        return self._preds_py[i]
+
+    # ------------------------------------------------------------------ #
+    # Materialisation                                                     #
+    # ------------------------------------------------------------------ #
+
+    def to_activities(self) -> Dict[str, Activity]:
+        """Materialise ``{id: Activity}`` for the UI / persistence layers."""
+        cols = [self._buf[name][: self._size].tolist() for name in _INT_COLUMNS]
+        crit = self.is_critical.tolist()
+        out: Dict[str, Activity] = {}
+        for i, act_id in enumerate(self._ids):
+            dur, es, ef, ls, lf, tf, ff = (c[i] for c in cols)
+            out[act_id] = Activity(
+                id=act_id,
+                name=self._names[i],
+                duration=dur,
+                predecessors=self._preds_py[i],
+                resource=self._resources[i],
+                description=self._descriptions[i],
+                ES=es,
+                EF=ef,
+                LS=ls,
+                LF=lf,
+                total_float=tf,
+                free_float=ff,
+                is_critical=crit[i],
+            )
+        return out
+
+    def _export_columns(self) -> Dict[str, list]:
+        """Return every column as a plain list, keyed and ordered like ``Activity.to_dict``."""
+        return {
+            "id":           self._ids,
+            "name":         self._names,
+            "duration":     self.duration.tolist(),
+            "predecessors": [",".join(p) for p in self._preds_py],
+            "resource":     [r or "" for r in self._resources],
+            "description":  [d or "" for d in self._descriptions],
+            "ES":           self.ES.tolist(),
+            "EF":           self.EF.tolist(),
+            "LS":           self.LS.tolist(),
+            "LF":           self.LF.tolist(),
+            "total_float":  self.total_float.tolist(),
+            "free_float":   self.free_float.tolist(),
+            "is_critical":  self.is_critical.tolist(),
+        }
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Return the table as a pandas DataFrame (one column per field).
+
+        Numeric columns are handed over as NumPy arrays, so no per-row dict is
+        ever built.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for DataFrame export.  Run: pip install pandas")
+
+        data = self._export_columns()
+        for name in _INT_COLUMNS + ("is_critical",):
+            data[name] = getattr(self, name).copy()
+        return pd.DataFrame(data, columns=list(_ACTIVITY_KEYS))
+
+    def to_json_array(self, **kwargs) -> str:
+        """
+        Serialise every row as one JSON array of ``Activity.to_dict``-shaped objects.
+
+        The whole array is encoded in a single call (orjson when available,
+        see ``activity._dumps``) rather than one ``to_json`` per row.
+        """
+        cols = self._export_columns()
+        rows = [dict(zip(_ACTIVITY_KEYS, values)) for values in zip(*cols.values())]
+        return _dumps(rows, **kwargs)
@@ -6,15 +6,18 @@ Provides a styled modal QDialog that:
   - Validates all inputs before accepting, showing inline error messages.
   - Optionally validates that predecessor IDs reference activities that actually exist.
   - Exposes ``get_activity()`` to retrieve the fully constructed Activity instance.
+  - Can be kept and re-bound with ``reset()``, so repeat opens skip widget
+    construction and style polishing.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Final, FrozenSet, Iterable, Optional, Tuple
 
-from PySide6.QtCore import Qt, QRegularExpression
+from PySide6.QtCore import Qt, QRegularExpression, QTimer
 from PySide6.QtGui import QFont, QRegularExpressionValidator
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QDialogButtonBox,
     QFrame,
@@ -29,124 +32,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from activity import Activity
-
-
-# ================== LIGHT THEME STYLESHEET ==================
-_DIALOG_QSS = """
-QDialog {
-    background-color: #f8f8f8;
-    color: #202020;
-}
-
-/* ── Labels ── */
-QLabel {
-    color: #404040;
-    font-size: 12px;
-}
-QLabel#title_label {
-    color: #1e5c8a;
-    font-size: 16px;
-    font-weight: bold;
-}
-QLabel#section_label {
-    color: #606060;
-    font-size: 11px;
-    font-weight: bold;
-    letter-spacing: 1px;
-    text-transform: uppercase;
-}
-QLabel#hint_label {
-    color: #808080;
-    font-size: 11px;
-    font-style: italic;
-}
-QLabel#error_label {
-    color: #c04040;
-    font-size: 12px;
-    background-color: #ffe0e0;
-    border: 1px solid #c04040;
-    border-radius: 4px;
-    padding: 5px 8px;
-}
-QLabel#success_label {
-    color: #2a7a2a;
-    font-size: 12px;
-}
-
-/* ── Inputs ── */
-QLineEdit, QSpinBox {
-    background-color: #ffffff;
-    color: #202020;
-    border: 1px solid #c0c0c0;
-    border-radius: 4px;
-    padding: 6px 10px;
-    font-size: 13px;
-    min-height: 28px;
-}
-QLineEdit:focus, QSpinBox:focus {
-    border: 1px solid #3a7ca5;
-    background-color: #f0f8ff;
-}
-QLineEdit:hover, QSpinBox:hover {
-    border: 1px solid #a0a0a0;
-}
-QLineEdit[readOnly="true"] {
-    background-color: #f0f0f0;
-    color: #808080;
-    border: 1px solid #d0d0d0;
-}
-QLineEdit[valid="false"] {
-    border: 1px solid #c04040;
-    background-color: #fff0f0;
-}
-QLineEdit[valid="true"] {
-    border: 1px solid #2a7a2a;
-}
-
-/* ── Buttons ── */
-QPushButton {
-    background-color: #ffffff;
-    color: #404040;
-    border: 1px solid #c0c0c0;
-    border-radius: 4px;
-    padding: 7px 18px;
-    font-size: 12px;
-    min-width: 80px;
-}
-QPushButton:hover {
-    background-color: #e0e0e0;
-}
-QPushButton:pressed {
-    background-color: #d0d0d0;
-}
-QPushButton[accent="true"] {
-    background-color: #3a7ca5;
-    color: #ffffff;
-    border: 1px solid #2a5a80;
-    font-weight: bold;
-}
-QPushButton[accent="true"]:hover {
-    background-color: #2a6a90;
-}
-QPushButton[accent="true"]:pressed {
-    background-color: #1e5a80;
-}
-QPushButton[accent="true"]:disabled {
-    background-color: #e0e0e0;
-    color: #a0a0a0;
-    border: 1px solid #d0d0d0;
-}
-
-/* ── Divider ── */
-QFrame[frameShape="4"],   /* HLine */
-QFrame[frameShape="5"] {  /* VLine */
-    color: #d0d0d0;
-    background-color: #d0d0d0;
-    max-height: 1px;
-}
-"""
-# ============================================================
+from activity import Activity, _parse_predecessors
+
+
+# Typing bursts within this window collapse into one _clear_error call.
+_CLEAR_DEBOUNCE_MS: Final[int] = 150
+
+# Allowed Activity ID characters; compiled once at import.
+_ID_RE: Final[QRegularExpression] = QRegularExpression(r"^[A-Za-z0-9_\-]{1,32}$")
 
 
 class ActivityDialog(QDialog):
@@ -160,44 +53,53 @@ class ActivityDialog(QDialog):
     activity : Activity, optional
         If provided, the dialog opens in *edit mode* with all fields pre-filled.
         The Activity ID field is locked in this mode.
-    existing_ids : list[str], optional
+    existing_ids : iterable of str, optional
         IDs already present in the project.  Used to prevent duplicate IDs when
-        adding a new activity.
+        adding a new activity.  Stored as a frozenset for O(1) lookups
+        (a frozenset argument is stored as-is).
     """
 
+    # Shared across all instances; created on first construction.
+    _id_validator: Optional[QRegularExpressionValidator] = None
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
         activity: Optional[Activity] = None,
-        existing_ids: Optional[List[str]] = None,
+        existing_ids: Optional[Iterable[str]] = None,
     ) -> None:
         super().__init__(parent)
 
-        self._existing_ids: List[str] = [str(i) for i in (existing_ids or [])]
-        self._edit_mode: bool = activity is not None
+        self._existing_ids: FrozenSet[str] = frozenset()
+        self._edit_mode: bool = False
+        # Parsed predecessor IDs, kept in sync with the predecessor field.
+        self._pred_cache: Tuple[str, ...] = ()
+
+        self._clear_timer = QTimer(self)
+        self._clear_timer.setSingleShot(True)
+        self._clear_timer.setInterval(_CLEAR_DEBOUNCE_MS)
 
-        self._build_ui(activity)
+        self._build_ui()
         self._connect_signals()
+        self.reset(activity, existing_ids)
 
     # ------------------------------------------------------------------ #
     # UI construction                                                      #
     # ------------------------------------------------------------------ #
 
-    def _build_ui(self, activity: Optional[Activity]) -> None:
-        """Construct and arrange all widgets."""
+    def _build_ui(self) -> None:
+        """Construct and arrange all widgets (field values are set by ``reset``)."""
 
-        self.setWindowTitle("Edit Activity" if self._edit_mode else "Add Activity")
+        self.setObjectName("ActivityDialog")      # styled by styles.APP_QSS
         self.setMinimumWidth(460)
         self.setModal(True)
-        self.setStyleSheet(_DIALOG_QSS)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(24, 20, 24, 20)
         root.setSpacing(14)
 
         # ── Title ──────────────────────────────────────────────────────
-        title_text = "Edit Activity" if self._edit_mode else "New Activity"
-        self._title_lbl = QLabel(title_text)
+        self._title_lbl = QLabel()
         self._title_lbl.setObjectName("title_label")
         root.addWidget(self._title_lbl)
 
@@ -213,20 +115,13 @@ class ActivityDialog(QDialog):
         self._id_edit = QLineEdit()
         self._id_edit.setPlaceholderText("e.g. A, B, ACT-01 …")
         self._id_edit.setMaxLength(32)
-        if self._edit_mode and activity:
-            self._id_edit.setText(activity.id)
-            self._id_edit.setReadOnly(True)
-            self._id_edit.setToolTip("Activity ID cannot be changed in edit mode.")
-        else:
-            self._id_edit.setToolTip("Unique identifier for this activity.")
+        self._id_edit.setValidator(self._shared_id_validator())
         form.addRow("Activity ID *", self._id_edit)
 
         # Name
         self._name_edit = QLineEdit()
         self._name_edit.setPlaceholderText("Short description of work to be done")
         self._name_edit.setMaxLength(120)
-        if activity:
-            self._name_edit.setText(activity.name)
         self._name_edit.setToolTip("Human-readable activity name.")
         form.addRow("Name *", self._name_edit)
 
@@ -238,8 +133,6 @@ class ActivityDialog(QDialog):
         self._duration_spin.setToolTip(
             "Duration in working days.  Use 0 for milestones."
         )
-        if activity:
-            self._duration_spin.setValue(activity.duration)
         form.addRow("Duration *", self._duration_spin)
 
         # Predecessors
@@ -249,8 +142,6 @@ class ActivityDialog(QDialog):
             "Comma-separated IDs of activities that must finish before this one starts.\n"
             "Only Finish-to-Start (FS) relationships are supported."
         )
-        if activity:
-            self._pred_edit.setText(",".join(activity.predecessors))
         form.addRow("Predecessors", self._pred_edit)
 
         # Resource (new optional field)
@@ -258,8 +149,6 @@ class ActivityDialog(QDialog):
         self._resource_edit.setPlaceholderText("e.g. Civil Team, John D.")
         self._resource_edit.setMaxLength(80)
         self._resource_edit.setToolTip("Responsible resource or team (optional, informational).")
-        if activity and activity.resource:
-            self._resource_edit.setText(activity.resource)
         form.addRow("Resource", self._resource_edit)
 
         # Description / Notes (new optional field)
@@ -267,8 +156,6 @@ class ActivityDialog(QDialog):
         self._desc_edit.setPlaceholderText("Additional notes or scope details (optional)")
         self._desc_edit.setMaxLength(255)
         self._desc_edit.setToolTip("Extended description or scope notes.")
-        if activity and activity.description:
-            self._desc_edit.setText(activity.description)
         form.addRow("Description", self._desc_edit)
 
         root.addLayout(form)
@@ -318,9 +205,14 @@ class ActivityDialog(QDialog):
         self._ok_btn.clicked.connect(self._on_accept)
 
         # Live validation feedback: clear error highlight when user edits
-        self._id_edit.textChanged.connect(self._clear_error)
-        self._name_edit.textChanged.connect(self._clear_error)
-        self._pred_edit.textChanged.connect(self._clear_error)
+        # (debounced, so a burst of keystrokes triggers a single clear).
+        self._clear_timer.timeout.connect(self._clear_error)
+        self._id_edit.textChanged.connect(self._schedule_clear)
+        self._name_edit.textChanged.connect(self._schedule_clear)
+        self._pred_edit.textChanged.connect(self._schedule_clear)
+
+        # Keep the parsed predecessor list current.
+        self._pred_edit.textChanged.connect(self._on_pred_changed)
 
     # ------------------------------------------------------------------ #
     # Validation                                                           #
@@ -337,7 +229,6 @@ class ActivityDialog(QDialog):
         """
         act_id = self._id_edit.text().strip()
         name = self._name_edit.text().strip()
-        preds_raw = self._pred_edit.text().strip()
 
         # --- Required fields ---
         if not act_id:
@@ -351,7 +242,7 @@ class ActivityDialog(QDialog):
             return f"Activity ID '{act_id}' already exists in this project."
 
         # --- Self-loop guard ---
-        pred_list = [p.strip() for p in preds_raw.split(",") if p.strip()]
+        pred_list = self._pred_cache
         if act_id in pred_list:
             return f"An activity cannot be its own predecessor ('{act_id}')."
 
@@ -359,8 +250,7 @@ class ActivityDialog(QDialog):
         if self._existing_ids:
             # In edit mode the current activity's id is already in existing_ids;
             # in add mode it is not yet — we don't add it here to keep this method pure.
-            known_ids = set(self._existing_ids)
-            unknown = [p for p in pred_list if p not in known_ids]
+            unknown = [p for p in pred_list if p not in self._existing_ids]
             if unknown:
                 return (
                     f"Unknown predecessor ID(s): {', '.join(unknown)}.\n"
@@ -384,9 +274,19 @@ class ActivityDialog(QDialog):
 
     def _show_error(self, msg: str) -> None:
         """Display an inline error banner below the form."""
+        # A pending debounced clear from earlier typing must not hide it.
+        self._clear_timer.stop()
         self._error_lbl.setText("⚠  " + msg)
         self._error_lbl.show()
 
+    def _on_pred_changed(self, text: str) -> None:
+        """Re-parse the predecessor field into ``_pred_cache``."""
+        self._pred_cache = _parse_predecessors(text)
+
+    def _schedule_clear(self) -> None:
+        """(Re)start the debounce timer; ``_clear_error`` runs once typing pauses."""
+        self._clear_timer.start()
+
     def _clear_error(self) -> None:
         """Hide the error banner (called on user edit)."""
         if self._error_lbl.isVisible():
@@ -396,6 +296,48 @@ class ActivityDialog(QDialog):
     # Public API                                                           #
     # ------------------------------------------------------------------ #
 
+    def reset(
+        self,
+        activity: Optional[Activity] = None,
+        existing_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Re-bind the dialog to *activity* (edit mode) or a blank form (add mode).
+
+        Only field values and mode-dependent labels change; the widget tree
+        and its stylesheet polish are reused as-is.
+        """
+        # Activity ids are interned on construction, so the keys can be taken
+        # as-is; an existing frozenset is reused without copying.
+        self._existing_ids = frozenset(existing_ids or ())
+        self._edit_mode = activity is not None
+
+        self.setWindowTitle("Edit Activity" if self._edit_mode else "Add Activity")
+        self._title_lbl.setText("Edit Activity" if self._edit_mode else "New Activity")
+
+        if self._id_edit.isReadOnly() != self._edit_mode:
+            self._id_edit.setReadOnly(self._edit_mode)
+            # The stylesheet's [readOnly="true"] rule is only matched at polish
+            # time, so a reused dialog must re-polish when the mode flips.
+            style = self._id_edit.style()
+            style.unpolish(self._id_edit)
+            style.polish(self._id_edit)
+        self._id_edit.setToolTip(
+            "Activity ID cannot be changed in edit mode." if self._edit_mode
+            else "Unique identifier for this activity."
+        )
+        self._id_edit.setText(activity.id if activity else "")
+        self._name_edit.setText(activity.name if activity else "")
+        self._duration_spin.setValue(activity.duration if activity else 0)
+        self._pred_edit.setText(",".join(activity.predecessors) if activity else "")
+        self._resource_edit.setText((activity.resource or "") if activity else "")
+        self._desc_edit.setText((activity.description or "") if activity else "")
+
+        # Drop any feedback left over from the previous use.
+        self._clear_timer.stop()
+        self._error_lbl.hide()
+        (self._name_edit if self._edit_mode else self._id_edit).setFocus()
+
     def get_activity(self) -> Activity:
         """
         Build and return the Activity from the current dialog inputs.
@@ -410,7 +352,7 @@ class ActivityDialog(QDialog):
         act_id = self._id_edit.text().strip()
         name = self._name_edit.text().strip()
         duration = self._duration_spin.value()
-        preds = [p.strip() for p in self._pred_edit.text().split(",") if p.strip()]
+        preds = self._pred_cache          # immutable tuple, shared as-is
         resource = self._resource_edit.text().strip() or None
         description = self._desc_edit.text().strip() or None
 
@@ -427,6 +369,13 @@ class ActivityDialog(QDialog):
     # Static / private helpers                                             #
     # ------------------------------------------------------------------ #
 
+    @classmethod
+    def _shared_id_validator(cls) -> QRegularExpressionValidator:
+        """Return the ID validator shared by all dialogs (owned by the QApplication)."""
+        if cls._id_validator is None:
+            cls._id_validator = QRegularExpressionValidator(_ID_RE, QApplication.instance())
+        return cls._id_validator
+
     @staticmethod
     def _make_divider() -> QFrame:
         """Return a styled horizontal rule widget."""
@@ -5,17 +5,22 @@ Fixes applied
 -------------
 * predecessors isinstance check corrected: Activity stores a tuple, not a list.
 * Free Float (FF) column added to the grid.
+
+The grid is a ``QTableView`` over `ActivityTableModel`: cell text and colours
+are computed in ``data()`` only for the rows Qt actually paints, so a
+repopulate is one model reset instead of a ``QTableWidgetItem`` per cell.
 """
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QHeaderView,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QPushButton, QLabel, QHeaderView,
     QAbstractItemView, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex, QSignalBlocker
 from PySide6.QtGui import QColor, QFont, QBrush
 
 from activity import Activity
-from typing import Dict, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Column definitions: (header label, attribute name, width)
@@ -51,6 +56,134 @@ CLR_TEXT        = QColor("#c8d8e8")
 CLR_DIM         = QColor("#4a5a6a")
 CLR_SELECT_BG   = QColor("#1e4a6a")
 
+# Brushes handed out by the model's BackgroundRole / ForegroundRole (built once)
+_BRUSHES = {
+    "row_even": QBrush(CLR_ROW_EVEN),
+    "row_odd":  QBrush(CLR_ROW_ODD),
+    "crit_bg":  QBrush(CLR_CRITICAL),
+    "crit_fg":  QBrush(CLR_CRITICAL_FG),
+    "text":     QBrush(CLR_TEXT),
+    "float0":   QBrush(CLR_FLOAT_ZERO),
+    "dim":      QBrush(CLR_DIM),
+}
+
+
+# One C-level call fetches a whole row's column values
+_ROW_GETTER = attrgetter(*COL_ATTRS)
+_I_ID    = COL_ATTRS.index("id")
+_I_EF    = COL_ATTRS.index("EF")
+_I_TF    = COL_ATTRS.index("total_float")
+_I_CRIT  = COL_ATTRS.index("is_critical")
+
+# Columns greyed out until the project has been scheduled (EF == 0)
+_CPM_ATTRS = frozenset(("ES", "EF", "LS", "LF", "total_float", "free_float"))
+
+_ALIGN_CENTER = Qt.AlignCenter
+_ALIGN_LEFT   = Qt.AlignVCenter | Qt.AlignLeft
+ROW_HEIGHT    = 28
+
+
+class ActivityTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the project's activities.
+
+    Rows are kept as a list for positional access plus an ``id → row`` map;
+    nothing is formatted until the view asks for a visible cell.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._acts: List[Activity] = []
+        self._rows: List[Tuple[Any, ...]] = []     # column values, per row
+        self._row_of: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Data loading
+    # ------------------------------------------------------------------
+
+    def set_activities(self, activities: Dict[str, Activity]):
+        """
+        Point the model at *activities*.
+
+        If the row IDs are unchanged (e.g. after scheduling or an edit) only
+        ``dataChanged`` is emitted, which keeps the view's selection; any
+        add/remove/reorder resets the model.
+        """
+        acts = list(activities.values())
+        if acts and list(activities) == list(self._row_of):
+            self._acts = acts
+            self._rows = [_ROW_GETTER(a) for a in acts]
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(acts) - 1, len(COLUMNS) - 1)
+            )
+            return
+        self.beginResetModel()
+        self._acts = acts
+        self._rows = [_ROW_GETTER(a) for a in acts]
+        self._row_of = {act.id: row for row, act in enumerate(acts)}
+        self.endResetModel()
+
+    def activity_at(self, row: int) -> Activity:
+        return self._acts[row]
+
+    def row_of(self, act_id: str) -> Optional[int]:
+        return self._row_of.get(act_id)
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel interface
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._acts)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COL_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        vals = self._rows[row]
+        attr = COL_ATTRS[col]
+
+        if role == Qt.DisplayRole:
+            value = vals[col]
+            if attr == "predecessors":
+                # FIX: Activity.predecessors is a tuple, not a list
+                return ",".join(value) if isinstance(value, (list, tuple)) else str(value)
+            if attr == "resource":
+                return value or ""
+            if attr == "is_critical":
+                return "★ YES" if value else ""
+            return str(value)
+
+        if role == Qt.BackgroundRole:
+            if vals[_I_CRIT]:
+                return _BRUSHES["crit_bg"]
+            return _BRUSHES["row_even" if row % 2 == 0 else "row_odd"]
+
+        if role == Qt.ForegroundRole:
+            if vals[_I_CRIT]:
+                return _BRUSHES["crit_fg" if col == _I_CRIT else "text"]
+            if col == _I_TF and vals[_I_TF] == 0 and vals[_I_EF] > 0:
+                return _BRUSHES["float0"]
+            if attr in _CPM_ATTRS and vals[_I_EF] == 0:
+                return _BRUSHES["dim"]
+            return _BRUSHES["text"]
+
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_LEFT if col == 1 else _ALIGN_CENTER
+
+        if role == Qt.UserRole:
+            return vals[_I_ID]   # ID for lookup
+
+        return None
+
 
 class ActivityTable(QWidget):
     """
@@ -71,38 +204,7 @@ class ActivityTable(QWidget):
     # ------------------------------------------------------------------
 
     def _setup_ui(self):
-        self.setStyleSheet(f"""
-            QWidget {{ background-color: {CLR_BG.name()}; }}
-            QTableWidget {{
-                background-color: {CLR_BG.name()};
-                color: {CLR_TEXT.name()};
-                gridline-color: #2a3545;
-                border: none;
-                font-size: 12px;
-                selection-background-color: {CLR_SELECT_BG.name()};
-            }}
-            QHeaderView::section {{
-                background-color: {CLR_HEADER_BG.name()};
-                color: {CLR_HEADER_FG.name()};
-                padding: 5px 8px;
-                border: none;
-                border-right: 1px solid #2a3545;
-                border-bottom: 2px solid #2a3545;
-                font-size: 11px;
-                font-weight: bold;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }}
-            QScrollBar:vertical {{
-                background: #1a2230;
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: #3a4a5a;
-                border-radius: 5px;
-            }}
-        """)
+        self.setObjectName("ActivityTable")      # styled by styles.APP_QSS
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -113,9 +215,12 @@ class ActivityTable(QWidget):
         layout.addWidget(toolbar)
 
         # Table
-        self.table = QTableWidget(0, len(COLUMNS))
-        self.table.setHorizontalHeaderLabels(COL_HEADERS)
+        self.model = ActivityTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)   # ← enforce single row selection
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -129,49 +234,19 @@ class ActivityTable(QWidget):
         self.table.horizontalHeader().setStretchLastSection(False)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
 
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().currentRowChanged.connect(self._on_selection_changed)
         self.table.doubleClicked.connect(self._on_double_click)
         layout.addWidget(self.table)
 
     def _build_toolbar(self) -> QWidget:
         bar = QFrame()
-        bar.setStyleSheet("""
-            QFrame {
-                background-color: #161e2a;
-                border-bottom: 1px solid #2a3545;
-            }
-            QPushButton {
-                background-color: transparent;
-                color: #6a8fae;
-                border: 1px solid #2a3545;
-                border-radius: 4px;
-                padding: 5px 14px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #252f3d;
-                color: #90b8d8;
-            }
-            QPushButton#addBtn {
-                background-color: #1e4a6a;
-                color: #90d0f8;
-                border: 1px solid #2a6a98;
-            }
-            QPushButton#addBtn:hover {
-                background-color: #255878;
-            }
-            QPushButton#deleteBtn:hover {
-                background-color: #3d1e22;
-                color: #e05060;
-                border-color: #6a2030;
-            }
-        """)
+        bar.setObjectName("ActivityTableToolbar")
         row = QHBoxLayout(bar)
         row.setContentsMargins(10, 7, 10, 7)
         row.setSpacing(8)
 
         lbl = QLabel("ACTIVITIES")
-        lbl.setStyleSheet("color: #4a6a8a; font-size: 10px; font-weight: bold; letter-spacing: 1px;")
+        lbl.setObjectName("ActivityTableTitle")
         row.addWidget(lbl)
         row.addStretch()
 
@@ -199,62 +274,28 @@ class ActivityTable(QWidget):
     def populate(self, activities: Dict[str, Activity]):
         """Refresh table with the given activities dict."""
         self._activities = activities
-        self.table.setRowCount(0)
-
-        for act in activities.values():
-            self._append_row(act)
-
-    def _append_row(self, act: Activity):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setRowHeight(row, 28)
-
-        is_critical = act.is_critical
-        bg = CLR_CRITICAL if is_critical else (CLR_ROW_EVEN if row % 2 == 0 else CLR_ROW_ODD)
-
-        for col, attr in enumerate(COL_ATTRS):
-            value = getattr(act, attr)
-
-            # Format value for display
-            if attr == "predecessors":
-                # FIX: Activity.predecessors is a tuple, not a list
-                text = ",".join(value) if isinstance(value, (list, tuple)) else str(value)
-            elif attr == "resource":
-                text = value or ""
-            elif attr == "is_critical":
-                text = "★ YES" if value else ""
-            else:
-                text = str(value)
-
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignCenter if col != 1 else Qt.AlignVCenter | Qt.AlignLeft)
-
-            # Colours
-            item.setBackground(QBrush(bg))
-            if is_critical:
-                item.setForeground(QBrush(CLR_CRITICAL_FG if attr == "is_critical" else CLR_TEXT))
-            elif attr == "total_float" and act.total_float == 0 and act.EF > 0:
-                item.setForeground(QBrush(CLR_FLOAT_ZERO))
-            elif attr in ("ES", "EF", "LS", "LF", "total_float", "free_float") and act.EF == 0:
-                item.setForeground(QBrush(CLR_DIM))
-            else:
-                item.setForeground(QBrush(CLR_TEXT))
-
-            item.setData(Qt.UserRole, act.id)  # store ID for lookup
-            self.table.setItem(row, col, item)
+        # One repaint at the end, and no activity_selected emits while the
+        # model resets (the view's current row is cleared mid-rebuild).
+        self.table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+        try:
+            self.model.set_activities(activities)
+        finally:
+            blocker.unblock()
+            self.table.setUpdatesEnabled(True)
 
     def selected_id(self) -> Optional[str]:
-        selected = self.table.selectedItems()
-        if selected:
-            return selected[0].data(Qt.UserRole)
+        rows = self.table.selectionModel().selectedRows()
+        if rows:
+            return self.model.activity_at(rows[0].row()).id
         return None
 
     # ------------------------------------------------------------------
     # Signals / slots
     # ------------------------------------------------------------------
 
-    def _on_selection_changed(self):
-        act_id = self.selected_id()
+    def _on_selection_changed(self, current, _previous=None):
+        act_id = current.data(Qt.UserRole) if current.isValid() else None
         if act_id:
             self.activity_selected.emit(act_id)
 
@@ -0,0 +1,136 @@
+"""
+Compiled CPM kernels for Mini-P7.
+
+Each kernel works on the flat integer arrays of an `ActivityArrays` table
+(see activity_arrays.py).  ``topological_levels`` produces the row order;
+the passes then walk rows in that order:
+
+    forward_pass    → ES / EF   (max over predecessors' EF)
+    backward_pass   → LF / LS   (min over successors' LS)
+                      and FF    (min over successors' ES, minus EF)
+
+``mark_reachable`` supports incremental re-scheduling by marking the rows a
+change can affect.
+
+When Numba is installed the kernels are JIT-compiled to native code; the
+compiled machine code is cached on disk (``cache=True``) so the compile cost
+is only paid on the very first run.  Without Numba the same functions run as
+plain Python, so results are identical either way — only speed differs.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is an optional accelerator
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def topological_levels(succ_idx, succ_off, in_degree, order, level_off):
+    """
+    Kahn's algorithm with ``order`` itself as the FIFO queue.
+
+    Rows are appended at ``tail`` and consumed at ``head``; every row is
+    enqueued at most once, so a preallocated array of ``n`` slots never
+    overflows and no per-row objects are allocated.  Rows queued while one
+    level is consumed form the next level; ``level_off[k]`` marks where
+    level ``k`` starts.  ``in_degree`` is consumed.  Returns
+    ``(rows_ordered, level_count)`` — fewer than ``n`` rows means a cycle.
+    """
+    tail = 0
+    for i in range(in_degree.size):
+        if in_degree[i] == 0:
+            order[tail] = i
+            tail += 1
+
+    head = 0
+    levels = 0
+    level_off[0] = 0
+    while head < tail:
+        end = tail
+        while head < end:
+            i = order[head]
+            head += 1
+            for p in range(succ_off[i], succ_off[i + 1]):
+                s = succ_idx[p]
+                in_degree[s] -= 1
+                if in_degree[s] == 0:
+                    order[tail] = s
+                    tail += 1
+        levels += 1
+        level_off[levels] = end
+    return tail, levels
+
+
+@njit(cache=True)
+def forward_pass(order, duration, ES, EF, pred_idx, pred_off):
+    """ES = max(EF of predecessors) (0 for start activities); EF = ES + duration."""
+    for k in range(order.size):
+        i = order[k]
+        s = 0
+        for p in range(pred_off[i], pred_off[i + 1]):
+            v = EF[pred_idx[p]]
+            if v > s:
+                s = v
+        ES[i] = s
+        EF[i] = s + duration[i]
+
+
+@njit(cache=True)
+def backward_pass(order, duration, ES, EF, LS, LF, FF, succ_idx, succ_off, project_finish):
+    """
+    LF = min(LS of successors) (project finish for end activities); LS = LF - duration.
+
+    Free float is fused into the same successor walk: FF = min(ES of
+    successors) - EF, or project finish - EF for end activities.
+    """
+    for k in range(order.size - 1, -1, -1):
+        i = order[k]
+        f = project_finish
+        m = project_finish
+        for p in range(succ_off[i], succ_off[i + 1]):
+            s = succ_idx[p]
+            v = LS[s]
+            if v < f:
+                f = v
+            v = ES[s]
+            if v < m:
+                m = v
+        LF[i] = f
+        LS[i] = f - duration[i]
+        FF[i] = m - EF[i]
+
+
+@njit(cache=True)
+def mark_reachable(start, idx, off, mark, stack):
+    """
+    Set ``mark`` for every row in ``start`` and every row reachable from them
+    through the CSR ``(idx, off)``.
+
+    Depth-first with ``stack`` (``n`` preallocated slots) as the work list;
+    rows are marked when pushed, so each is pushed at most once.
+    """
+    top = 0
+    for k in range(start.size):
+        r = start[k]
+        if not mark[r]:
+            mark[r] = True
+            stack[top] = r
+            top += 1
+    while top > 0:
+        top -= 1
+        i = stack[top]
+        for p in range(off[i], off[i + 1]):
+            j = idx[p]
+            if not mark[j]:
+                mark[j] = True
+                stack[top] = j
+                top += 1
@@ -10,24 +10,78 @@ Fixes applied
 * ``load_all_activities`` rewritten to use the ORM directly (no raw SQL).
 * ``_record_to_activity`` / ``_activity_to_record`` updated for all fields.
 """
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, delete, event, exists, select, update
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 #typing import unused 
-from models import Base, ActivityRecord
-from activity import Activity
+from models import Base, ActivityRecord, PredecessorLink
+from activity import Activity, _parse_predecessors
 
 
 _engine = None
 _SessionLocal = None
 
+# Rows per batch when streaming activities out of the database
+_LOAD_BATCH = 256
+
+# Session of the innermost active ``session_scope`` (None outside any scope)
+_active_session: ContextVar[Optional[Session]] = ContextVar("_active_session", default=None)
+
 
 def init_db(db_path: str = "mini_p6.db"):
     """Initialize the database (create tables if needed)."""
     global _engine, _SessionLocal
     _engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    event.listen(_engine, "connect", _set_sqlite_pragmas)
     Base.metadata.create_all(_engine)
+    _create_missing_indexes()
     _SessionLocal = sessionmaker(bind=_engine)
+    _migrate_csv_predecessors()
+
+
+def _create_missing_indexes():
+    """
+    ``create_all`` skips tables that already exist, including their indexes;
+    add any index declared in models.py that an older database lacks.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(_engine, checkfirst=True)
+
+
+def _set_sqlite_pragmas(dbapi_conn, _conn_record):
+    """WAL journal + NORMAL sync: one fsync per checkpoint instead of per commit."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _migrate_csv_predecessors():
+    """
+    Move predecessors still stored in the legacy CSV column into
+    ``predecessor_links`` (databases written before the link table existed),
+    then blank the column so the migration never re-applies.
+    """
+    with session_scope() as session:
+        rows = session.execute(
+            select(ActivityRecord.id, ActivityRecord.predecessors)
+            .where(ActivityRecord.predecessors != "")
+        ).all()
+        if not rows:
+            return
+        ids = [r.id for r in rows]
+        session.execute(delete(PredecessorLink).where(PredecessorLink.activity_id.in_(ids)))
+        session.bulk_insert_mappings(PredecessorLink, [
+            {"activity_id": r.id, "pred_id": p, "position": i}
+            for r in rows
+            for i, p in enumerate(_parse_predecessors(r.predecessors))
+        ])
+        session.execute(
+            update(ActivityRecord).where(ActivityRecord.id.in_(ids)).values(predecessors="")
+        )
 
 
 def get_session() -> Session:
@@ -36,6 +90,34 @@ def get_session() -> Session:
     return _SessionLocal()
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Yield the session of the enclosing transaction, or open a new one.
+
+    The outermost scope commits on success, rolls back on error and closes
+    the session; nested scopes (e.g. CRUD helpers called inside a caller's
+    ``with session_scope():`` block) reuse it and leave committing to it, so
+    a batch of helper calls costs one session and one commit.
+    """
+    session = _active_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = get_session()
+    token = _active_session.set(session)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _active_session.reset(token)
+        session.close()
+
+
 # ------------------------------------------------------------------
 # CRUD helpers
 # ------------------------------------------------------------------
@@ -47,9 +129,15 @@ def load_all_activities() -> Dict[str, Activity]:
     FIX: previously used raw SQL with wrong table name ('activity_record')
          and missing resource/description/free_float columns.
          Now uses ORM query directly.
+
+    Rows are streamed in batches of ``_LOAD_BATCH`` (each batch's links
+    fetched with one selectin query) instead of materialising every
+    record before conversion.
     """
-    with get_session() as session:
-        records = session.query(ActivityRecord).all()
+    with session_scope() as session:
+        records = session.scalars(
+            select(ActivityRecord).execution_options(yield_per=_LOAD_BATCH)
+        )
         return {r.id: _record_to_activity(r) for r in records}
 
 
@@ -59,10 +147,8 @@ def save_activity(activity: Activity):
 
     Uses session.merge to combine the check and write in one operation.
     """
-    with get_session() as session:
-        record = _activity_to_record(activity)
-        session.merge(record)
-        session.commit()
+    with session_scope() as session:
+        session.merge(_activity_to_record(activity))
 
 
 def save_all_activities(activities: Dict[str, Activity]):
@@ -70,57 +156,74 @@ def save_all_activities(activities: Dict[str, Activity]):
     Bulk save / update all activities (used after CPM run).
 
     FIX: added resource, description, free_float to insert/update mappings.
+
+    One ``SELECT id`` partitions the rows, then each partition is written
+    with a single bulk statement and the whole save is one commit.  The
+    saved activities' predecessor links are replaced with one DELETE and
+    one bulk INSERT.
     """
-    with get_session() as session:
-        existing_ids = {row[0] for row in session.query(ActivityRecord.id).all()}
+    with session_scope() as session:
+        existing_ids = set(session.scalars(select(ActivityRecord.id)))
 
         insert_mappings = []
         update_mappings = []
+        link_mappings = []
         for act in activities.values():
-            mapping = {
-                "id":           act.id,
-                "name":         act.name,
-                "duration":     act.duration,
-                "predecessors": ",".join(act.predecessors),
-                "resource":     act.resource or "",
-                "description":  act.description or "",
-                "ES":           act.ES,
-                "EF":           act.EF,
-                "LS":           act.LS,
-                "LF":           act.LF,
-                "total_float":  act.total_float,
-                "free_float":   act.free_float,
-                "is_critical":  act.is_critical,
-            }
+            # to_dict() yields the ActivityRecord columns; predecessors live in links
+            mapping = act.to_dict()
+            del mapping["predecessors"]
             if act.id in existing_ids:
                 update_mappings.append(mapping)
             else:
                 insert_mappings.append(mapping)
+            link_mappings.extend(
+                {"activity_id": act.id, "pred_id": p, "position": i}
+                for i, p in enumerate(act.predecessors)
+            )
 
         if insert_mappings:
             session.bulk_insert_mappings(ActivityRecord, insert_mappings)
         if update_mappings:
             session.bulk_update_mappings(ActivityRecord, update_mappings)
 
-        session.commit()
+        session.execute(
+            delete(PredecessorLink).where(PredecessorLink.activity_id.in_(list(activities)))
+        )
+        if link_mappings:
+            session.bulk_insert_mappings(PredecessorLink, link_mappings)
 
 
 def delete_activity(activity_id: str):
     """Remove an activity from the database."""
-    with get_session() as session:
+    with session_scope() as session:
         record = session.get(ActivityRecord, activity_id)
         if record:
             session.delete(record)
-            session.commit()
+
+
+def delete_all_activities():
+    """Remove every activity and predecessor link (two bulk DELETEs)."""
+    with session_scope() as session:
+        session.execute(delete(PredecessorLink))
+        session.execute(delete(ActivityRecord))
+
+
+def replace_all_activities(activities: Dict[str, Activity]):
+    """
+    Replace the stored project with *activities* in one transaction.
+
+    The table is emptied in bulk, so ``save_all_activities`` sees no
+    existing ids and writes everything with bulk INSERTs.
+    """
+    with session_scope():
+        delete_all_activities()
+        save_all_activities(activities)
 
 
 def activity_id_exists(activity_id: str) -> bool:
-    with get_session() as session:
-        return (
-            session.query(ActivityRecord)
-            .filter(ActivityRecord.id == activity_id)
-            .first()
-        ) is not None
+    """EXISTS query — answers from the primary key without loading the row."""
+    with session_scope() as session:
+        return session.scalar(select(exists().where(ActivityRecord.id == activity_id)))
 
 
 # ------------------------------------------------------------------
@@ -129,7 +232,7 @@ def activity_id_exists(activity_id: str) -> bool:
 
 def _record_to_activity(r: ActivityRecord) -> Activity:
     """FIX: now includes resource, description, free_float."""
-    preds = tuple(p.strip() for p in r.predecessors.split(",") if p.strip())
+    preds = tuple(link.pred_id for link in r.links)    # already ordered by position
     return Activity(
         id=r.id,
         name=r.name,
@@ -153,7 +256,10 @@ def _activity_to_record(a: Activity) -> ActivityRecord:
         id=a.id,
         name=a.name,
         duration=a.duration,
-        predecessors=",".join(a.predecessors),
+        links=[
+            PredecessorLink(activity_id=a.id, pred_id=p, position=i)
+            for i, p in enumerate(a.predecessors)
+        ],
         resource=a.resource or "",
         description=a.description or "",
         ES=a.ES,
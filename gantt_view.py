@@ -5,18 +5,29 @@ Draws horizontal Gantt bars on a QGraphicsScene with:
   - Activity bars (colour-coded: critical = red, normal = steel blue)
   - Float bars (light grey)
   - Activity name labels on bars
+
+The static backdrop (row stripes, grid, header, day ticks) is a cached
+QPicture replayed as the `GanttCanvas` background (itself pixmap-cached by
+the view), and all rows are painted by one `GanttContentItem` that only draws
+the rows inside the exposed (visible) rectangle — so the scene holds one item
+regardless of project size and paint cost follows the viewport, not the row
+count.
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QGraphicsView, QGraphicsScene, QGraphicsRectItem,
-    QGraphicsTextItem, QGraphicsLineItem, QFrame, QLabel,
+    QGraphicsView, QGraphicsScene,
+    QGraphicsTextItem, QGraphicsItem, QFrame, QLabel,
     QSizePolicy
 )
-from PySide6.QtCore import Qt, QRectF
+from PySide6.QtCore import Qt, QRectF, QLineF, QPointF
 from PySide6.QtGui import (
-    QColor, QBrush, QPen, QFont, QPainter, QLinearGradient
+    QColor, QBrush, QPen, QFont, QFontMetricsF, QPainter, QLinearGradient, QPicture,
+    QStaticText, QTransform
 )
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from activity import Activity
 
@@ -47,6 +58,280 @@ CLR_ROW_ODD         = "#f2f2f2"       # light grey odd rows
 CLR_LABEL_COLUMN_BG = "#ececec"       # left column background
 # ==========================================================
 
+# ---- Shared paint objects (built once, reused by every render) ----
+_BRUSHES = {
+    "label_col":  QBrush(QColor(CLR_LABEL_COLUMN_BG)),
+    "row_even":   QBrush(QColor(CLR_ROW_EVEN)),
+    "row_odd":    QBrush(QColor(CLR_ROW_ODD)),
+    "header":     QBrush(QColor(CLR_HEADER_BG)),
+    "float":      QBrush(QColor(CLR_BAR_FLOAT)),
+    "bar_crit":   QBrush(QColor(CLR_BAR_CRIT)),
+    "bar_normal": QBrush(QColor(CLR_BAR_NORMAL)),
+}
+_PENS = {
+    "none":       QPen(Qt.NoPen),
+    "grid":       QPen(QColor(CLR_GRID), 1, Qt.DotLine),
+    "divider":    QPen(QColor("#c0c0c0"), 1),
+    "tick":       QPen(QColor("#b0b0b0"), 1),
+    "rule":       QPen(QColor("#b0b0b0"), 2),
+    "float":      QPen(QColor("#a0a0a0"), 1),
+    "bar_crit":   QPen(QColor(CLR_BAR_CRIT_BORDER), 1.5),
+    "bar_normal": QPen(QColor(CLR_BAR_NRM_BORDER), 1.5),
+}
+_TEXT_COLORS = {
+    "header":     QColor(CLR_HEADER_FG),
+    "label":      QColor(CLR_LABEL_FG),
+    "label_crit": QColor("#a00000"),
+    "bar":        QColor(CLR_BAR_TEXT),
+    "empty":      QColor("#808080"),
+}
+FONT_EMPTY   = QFont("Consolas", 12)
+FONT_HEADER  = QFont("Arial", 9, QFont.Bold)
+FONT_DAY     = QFont("Consolas", 9)
+FONT_BAR     = QFont("Arial", 9)
+FONT_LABEL   = QFont("Arial", 10)
+
+# QGraphicsTextItem's default document margin; the backdrop offsets its
+# painter-drawn text by the same amount so it lines up with the item labels.
+_TEXT_MARGIN = 4
+_TEXT_FLAGS  = Qt.AlignLeft | Qt.AlignTop
+
+
+@lru_cache(maxsize=8)
+def _backdrop_picture(total_days: int, row_count: int) -> QPicture:
+    """
+    Record the static Gantt backdrop for a *total_days* × *row_count* chart.
+
+    Cached per size, so re-rendering a schedule with the same span and row
+    count (the common edit / reschedule case) just replays the picture.
+    """
+    grid_w = total_days * DAY_W
+    body_h = row_count * ROW_H
+    body_bottom = HEADER_H + body_h
+
+    # Geometry for every tick / row in one vectorised step
+    days = np.arange(0, total_days + 1, 5)
+    tick_xs = (LABEL_W + days * DAY_W).tolist()
+    row_ys = (HEADER_H + np.arange(row_count + 1) * ROW_H).tolist()
+
+    pic = QPicture()
+    p = QPainter(pic)
+
+    # Left label column background
+    p.fillRect(QRectF(0, HEADER_H, LABEL_W, body_h), _BRUSHES["label_col"])
+
+    # Row stripes — one drawRects call per stripe colour
+    p.setPen(_PENS["none"])
+    for parity, key in ((0, "row_even"), (1, "row_odd")):
+        p.setBrush(_BRUSHES[key])
+        p.drawRects([QRectF(LABEL_W, y, grid_w, ROW_H) for y in row_ys[parity:-1:2]])
+
+    # Vertical grid lines (every 5 days)
+    p.setPen(_PENS["grid"])
+    p.drawLines([QLineF(x, HEADER_H, x, body_bottom) for x in tick_xs])
+
+    # Horizontal row dividers
+    p.setPen(_PENS["divider"])
+    p.drawLines([QLineF(0, y, LABEL_W + grid_w, y) for y in row_ys])
+
+    # Header background + "Activity" label
+    p.fillRect(QRectF(0, 0, LABEL_W + grid_w + 20, HEADER_H), _BRUSHES["header"])
+    p.setPen(_TEXT_COLORS["header"])
+    p.setFont(FONT_HEADER)
+    p.drawText(QRectF(10 + _TEXT_MARGIN, 8 + _TEXT_MARGIN, LABEL_W, HEADER_H), _TEXT_FLAGS, "Activity")
+
+    # Day ticks and labels (labels drawn at their baseline: no layout pass)
+    p.setPen(_PENS["tick"])
+    p.drawLines([QLineF(x, HEADER_H - 10, x, HEADER_H) for x in tick_xs])
+    p.setPen(_TEXT_COLORS["header"])
+    p.setFont(FONT_DAY)
+    label_y = 6 + _TEXT_MARGIN + QFontMetricsF(FONT_DAY).ascent()
+    for d, x in zip(days.tolist(), tick_xs):
+        p.drawText(QPointF(x - 10 + _TEXT_MARGIN, label_y), f"D{d}")
+
+    # Header bottom border and day-0 line
+    p.setPen(_PENS["rule"])
+    p.drawLine(QLineF(0, HEADER_H, LABEL_W + grid_w + 20, HEADER_H))
+    p.drawLine(QLineF(LABEL_W, 0, LABEL_W, body_bottom))
+
+    p.end()
+    return pic
+
+
+class GanttCanvas(QGraphicsView):
+    """
+    Gantt viewport that paints the static backdrop as the scene background.
+
+    With ``CacheBackground`` the view keeps the rendered backdrop in a
+    pixmap: scrolling blits it and only the newly exposed strip is replayed
+    from the QPicture, instead of repainting every stripe and grid line.
+    """
+
+    def __init__(self, scene: QGraphicsScene):
+        super().__init__(scene)
+        self._backdrop: Optional[QPicture] = None
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        # Items set their own pen / brush / font, so skip the save/restore
+        # around each one.
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState)
+
+    def set_backdrop(self, total_days: int, row_count: int) -> None:
+        """Show the backdrop for the given chart size (``row_count == 0`` clears it)."""
+        self._backdrop = _backdrop_picture(total_days, row_count) if row_count else None
+        self.resetCachedContent()
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if self._backdrop is not None:
+            # The background-cache painter does not inherit the view's hints.
+            painter.setRenderHints(self.renderHints())
+            painter.drawPicture(0, 0, self._backdrop)
+
+
+# Per-row label geometry (matches QGraphicsTextItem placement; see _TEXT_MARGIN)
+_BAR_H       = ROW_H - ROW_PAD * 2
+_LABEL_DY    = (ROW_H - 16) // 2 + _TEXT_MARGIN
+_LABEL_W     = LABEL_W - 8 - 2 * _TEXT_MARGIN
+_TEXT_FONTS  = {"label": FONT_LABEL, "bar": FONT_BAR}
+
+# Struct-of-arrays view of the CPM fields the bar layout reads
+_SCHED_DTYPE = np.dtype([
+    ("ES", "i4"), ("EF", "i4"), ("LS", "i4"), ("LF", "i4"),
+    ("duration", "i4"), ("total_float", "i4"), ("is_critical", "?"),
+])
+
+
+def _schedule_array(activities: List[Activity]) -> np.ndarray:
+    """Pack the CPM fields of *activities* into one ``_SCHED_DTYPE`` record array."""
+    return np.fromiter(
+        ((a.ES, a.EF, a.LS, a.LF, a.duration, a.total_float, bool(a.is_critical))
+         for a in activities),
+        dtype=_SCHED_DTYPE, count=len(activities),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _static_text(text: str, font: str, width: float = -1) -> QStaticText:
+    """
+    Laid-out *text* in ``_TEXT_FONTS[font]``, wrapped at *width* if given.
+
+    Cached by content, so labels that survive a reschedule (the usual case)
+    are not re-shaped; a renamed activity simply misses the cache.
+    """
+    st = QStaticText(text)
+    st.setTextFormat(Qt.PlainText)
+    st.setTextWidth(width)
+    st.prepare(QTransform(), _TEXT_FONTS[font])
+    return st
+
+
+class GanttContentItem(QGraphicsItem):
+    """
+    Paints every activity row (name label, float bar, activity bar) directly.
+
+    Row geometry is computed once when the item is built; ``paint`` only
+    visits the rows intersecting ``option.exposedRect``, so a scroll or
+    repaint touches the handful of visible rows, not the project.
+    """
+
+    def __init__(self, activities: List[Activity], sched: np.ndarray, total_days: int):
+        super().__init__()
+        # (label_pos, label, is_critical, bar_rect, float_rect, dur_pos, dur_label)
+        self._rows = self._row_geometry(activities, sched)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)   # fills exposedRect
+        self._bounds = QRectF(
+            0, HEADER_H, LABEL_W + total_days * DAY_W + 20, len(activities) * ROW_H
+        ).adjusted(-1, -1, 1, 1)
+
+    @staticmethod
+    def _row_geometry(activities: List[Activity], sched: np.ndarray) -> List[tuple]:
+        """Per-row paint tuples; the numeric layout is done column-wise on *sched*."""
+        es, ls, dur = sched["ES"], sched["LS"], sched["duration"]
+        bar_ys = HEADER_H + np.arange(len(sched)) * ROW_H + ROW_PAD
+        # No bars if not yet scheduled (EF == 0)
+        scheduled = ~((sched["EF"] == 0) & (es == 0) & (dur > 0) & (sched["LF"] == 0))
+        bar_xs = LABEL_W + es * DAY_W
+        bar_ws = np.maximum(dur * DAY_W, 2)
+        float_xs = LABEL_W + ls * DAY_W
+        float_ws = sched["total_float"] * DAY_W
+
+        rows = []
+        for act, bar_y, ok, crit, bx, bw, fx, fw, d in zip(
+            activities, bar_ys.tolist(), scheduled.tolist(), sched["is_critical"].tolist(),
+            bar_xs.tolist(), bar_ws.tolist(), float_xs.tolist(), float_ws.tolist(),
+            dur.tolist(),
+        ):
+            # Name label (wrapped to the label column)
+            label_pos = QPointF(4 + _TEXT_MARGIN, bar_y - ROW_PAD + _LABEL_DY)
+            label = _static_text(f"  {act.id}  {act.name}", "label", _LABEL_W)
+            if not ok:
+                rows.append((label_pos, label, crit, None, None, None, None))
+                continue
+
+            # Float bar (LS → LF, faded)
+            float_rect = QRectF(fx, bar_y + 6, fw, _BAR_H - 12) if fw > 0 else None
+
+            # Activity bar (ES → EF) and its duration label
+            bar_rect = QRectF(bx, bar_y, bw, _BAR_H)
+            dur_pos = dur_label = None
+            if bw > 24:
+                dur_pos = QPointF(bx + 4 + _TEXT_MARGIN, bar_y + 4 + _TEXT_MARGIN)
+                dur_label = _static_text(f"{d}d", "bar")
+            rows.append((label_pos, label, crit, bar_rect, float_rect, dur_pos, dur_label))
+        return rows
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        r0 = max(0, int((exposed.top() - HEADER_H) // ROW_H))
+        r1 = min(len(self._rows), int((exposed.bottom() - HEADER_H) // ROW_H) + 1)
+        rows = self._rows[r0:r1]
+        if not rows:
+            return
+
+        # Drawn layer by layer (labels, float bars, bars, bar text) so each
+        # pen / brush / font is set once per layer rather than once per row.
+
+        # ---- Activity name labels (left column, clipped to their row) ----
+        # Critical activities use a darker red text to stand out.  A long name
+        # wraps; the clip keeps it inside its row, so it can neither spill over
+        # the rows below nor be left half-drawn when its row is culled.
+        painter.setFont(FONT_LABEL)
+        current = None
+        for label_pos, label, crit, *_ in rows:
+            if crit is not current:
+                painter.setPen(_TEXT_COLORS["label_crit" if crit else "label"])
+                current = crit
+            painter.save()
+            painter.setClipRect(
+                QRectF(label_pos.x(), label_pos.y(), _LABEL_W, ROW_H - _LABEL_DY),
+                Qt.IntersectClip,
+            )
+            painter.drawStaticText(label_pos, label)
+            painter.restore()
+
+        # ---- Float bars, then activity bars on top ----
+        floats = [r[4] for r in rows if r[4] is not None]
+        if floats:
+            painter.setBrush(_BRUSHES["float"])
+            painter.setPen(_PENS["float"])
+            painter.drawRects(floats)
+        for crit, kind in ((True, "bar_crit"), (False, "bar_normal")):
+            bars = [r[3] for r in rows if r[3] is not None and r[2] is crit]
+            if bars:
+                painter.setBrush(_BRUSHES[kind])
+                painter.setPen(_PENS[kind])
+                painter.drawRects(bars)
+
+        # ---- Bar labels (duration text) ----
+        painter.setPen(_TEXT_COLORS["bar"])
+        painter.setFont(FONT_BAR)
+        for r in rows:
+            if r[6] is not None:
+                painter.drawStaticText(r[5], r[6])
+
 
 class GanttView(QWidget):
     """Gantt Chart panel."""
@@ -54,6 +339,7 @@ class GanttView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._activities: Dict[str, Activity] = {}
+        self._sched: np.ndarray = _schedule_array([])   # CPM fields of the rendered rows
         self._setup_ui()
 
     # ------------------------------------------------------------------
@@ -61,58 +347,36 @@ class GanttView(QWidget):
     # ------------------------------------------------------------------
 
     def _setup_ui(self):
-        self.setStyleSheet(f"background-color: {CLR_BG};")
+        self.setObjectName("GanttView")      # styled by styles.APP_QSS
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Toolbar strip
         toolbar = QFrame()
-        toolbar.setStyleSheet(f"""
-            QFrame {{
-                background-color: {CLR_HEADER_BG};
-                border-bottom: 1px solid #c0c0c0;
-            }}
-            QLabel {{
-                color: #404040;
-                font-size: 10px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }}
-        """)
+        toolbar.setObjectName("GanttToolbar")
         tb_row = QHBoxLayout(toolbar)
         tb_row.setContentsMargins(12, 7, 12, 7)
         lbl = QLabel("GANTT CHART")
         tb_row.addWidget(lbl)
         tb_row.addStretch()
         legend_crit = QLabel("■ Critical Path")
-        legend_crit.setStyleSheet(f"color: {CLR_BAR_CRIT}; font-size: 11px;")
+        legend_crit.setObjectName("GanttLegendCrit")
         tb_row.addWidget(legend_crit)
         legend_norm = QLabel("■ Normal")
-        legend_norm.setStyleSheet(f"color: {CLR_BAR_NORMAL}; font-size: 11px; margin-left: 10px;")
+        legend_norm.setObjectName("GanttLegendNormal")
         tb_row.addWidget(legend_norm)
         layout.addWidget(toolbar)
 
         # Graphics view
         self.scene = QGraphicsScene(self)
-        self.view = QGraphicsView(self.scene)
+        # The scene is rebuilt wholesale on every render, so a BSP index would
+        # only be paid for on insertion and thrown away on the next clear().
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.view = GanttCanvas(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing, True)
         self.view.setDragMode(QGraphicsView.ScrollHandDrag)
-        self.view.setStyleSheet(f"""
-            QGraphicsView {{
-                background-color: {CLR_BG};
-                border: none;
-            }}
-            QScrollBar:horizontal, QScrollBar:vertical {{
-                background: #e0e0e0;
-                height: 10px; width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:horizontal, QScrollBar::handle:vertical {{
-                background: #a0a0a0;
-                border-radius: 5px;
-            }}
-        """)
+        self.view.setObjectName("GanttCanvas")
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         layout.addWidget(self.view)
@@ -124,27 +388,36 @@ class GanttView(QWidget):
     def render_gantt(self, activities: Dict[str, Activity]):
         """Rebuild the entire scene from the activities dict."""
         self._activities = activities
+        # Suppress repaints while items are added; one update at the end.
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._rebuild_scene(activities)
+        finally:
+            self.view.setUpdatesEnabled(True)
+
+    def _rebuild_scene(self, activities: Dict[str, Activity]):
         self.scene.clear()
+        self.view.set_backdrop(0, 0)
+        acts = list(activities.values())
+        self._sched = _schedule_array(acts)
 
         if not activities:
             self._draw_empty_state()
             return
 
         # Determine project span
-        project_end = max(
-            (a.EF for a in activities.values() if a.EF > 0),
-            default=MIN_DAYS
-        )
+        ef = self._sched["EF"]
+        project_end = int(ef[ef > 0].max(initial=0)) or MIN_DAYS
         total_days = max(project_end + 2, MIN_DAYS)
 
+        self.view.set_backdrop(total_days, len(activities))
+        self.scene.addItem(GanttContentItem(acts, self._sched, total_days))
+
+        # Set once all items are in place
         scene_w = LABEL_W + total_days * DAY_W + 20
         scene_h = HEADER_H + len(activities) * ROW_H + 10
         self.scene.setSceneRect(0, 0, scene_w, scene_h)
 
-        self._draw_background(total_days, len(activities))
-        self._draw_header(total_days)
-        self._draw_bars(activities, total_days)
-
     # ------------------------------------------------------------------
     # Drawing helpers
     # ------------------------------------------------------------------
@@ -152,145 +425,7 @@ class GanttView(QWidget):
     def _draw_empty_state(self):
         self.scene.setSceneRect(0, 0, 600, 200)
         msg = QGraphicsTextItem("No scheduled data.\nAdd activities and click  ▶ Schedule  to compute the CPM.")
-        msg.setDefaultTextColor(QColor("#808080"))
-        font = QFont("Consolas", 12)
-        msg.setFont(font)
+        msg.setDefaultTextColor(_TEXT_COLORS["empty"])
+        msg.setFont(FONT_EMPTY)
         msg.setPos(80, 70)
         self.scene.addItem(msg)
-
-    def _draw_background(self, total_days: int, row_count: int):
-        # Left label column background
-        label_rect = QGraphicsRectItem(0, HEADER_H, LABEL_W, row_count * ROW_H)
-        label_rect.setBrush(QBrush(QColor(CLR_LABEL_COLUMN_BG)))
-        label_rect.setPen(QPen(Qt.NoPen))
-        self.scene.addItem(label_rect)
-
-        # Row stripes
-        for r in range(row_count):
-            y = HEADER_H + r * ROW_H
-            clr = CLR_ROW_EVEN if r % 2 == 0 else CLR_ROW_ODD
-            stripe = QGraphicsRectItem(LABEL_W, y, total_days * DAY_W, ROW_H)
-            stripe.setBrush(QBrush(QColor(clr)))
-            stripe.setPen(QPen(Qt.NoPen))
-            self.scene.addItem(stripe)
-
-        # Vertical grid lines (every 5 days)
-        pen_grid = QPen(QColor(CLR_GRID), 1, Qt.DotLine)
-        for d in range(0, total_days + 1, 5):
-            x = LABEL_W + d * DAY_W
-            line = QGraphicsLineItem(x, HEADER_H, x, HEADER_H + row_count * ROW_H)
-            line.setPen(pen_grid)
-            self.scene.addItem(line)
-
-        # Horizontal row dividers
-        pen_div = QPen(QColor("#c0c0c0"), 1)
-        for r in range(row_count + 1):
-            y = HEADER_H + r * ROW_H
-            divider = QGraphicsLineItem(0, y, LABEL_W + total_days * DAY_W, y)
-            divider.setPen(pen_div)
-            self.scene.addItem(divider)
-
-    def _draw_header(self, total_days: int):
-        # Header background
-        hdr_rect = QGraphicsRectItem(0, 0, LABEL_W + total_days * DAY_W + 20, HEADER_H)
-        hdr_rect.setBrush(QBrush(QColor(CLR_HEADER_BG)))
-        hdr_rect.setPen(QPen(Qt.NoPen))
-        self.scene.addItem(hdr_rect)
-
-        # "Activity" label in header
-        act_lbl = QGraphicsTextItem("Activity")
-        act_lbl.setDefaultTextColor(QColor(CLR_HEADER_FG))
-        act_lbl.setFont(QFont("Arial", 9, QFont.Bold))
-        act_lbl.setPos(10, 8)
-        self.scene.addItem(act_lbl)
-
-        # Day numbers
-        font_day = QFont("Consolas", 9)
-        pen_hdr_line = QPen(QColor("#b0b0b0"), 1)
-
-        for d in range(0, total_days + 1, 5):
-            x = LABEL_W + d * DAY_W
-            # Tick line
-            tick = QGraphicsLineItem(x, HEADER_H - 10, x, HEADER_H)
-            tick.setPen(pen_hdr_line)
-            self.scene.addItem(tick)
-
-            # Day label
-            lbl = QGraphicsTextItem(f"D{d}")
-            lbl.setDefaultTextColor(QColor(CLR_HEADER_FG))
-            lbl.setFont(font_day)
-            lbl.setPos(x - 10, 6)
-            self.scene.addItem(lbl)
-
-        # Header bottom border
-        hdr_line = QGraphicsLineItem(0, HEADER_H, LABEL_W + total_days * DAY_W + 20, HEADER_H)
-        hdr_line.setPen(QPen(QColor("#b0b0b0"), 2))
-        self.scene.addItem(hdr_line)
-
-    def _draw_bars(self, activities: Dict[str, Activity], total_days: int):
-        font_bar = QFont("Arial", 9)
-        font_lbl = QFont("Arial", 10)
-        pen_none = QPen(Qt.NoPen)
-
-        for row_idx, (act_id, act) in enumerate(activities.items()):
-            y = HEADER_H + row_idx * ROW_H
-            bar_y = y + ROW_PAD
-            bar_h = ROW_H - ROW_PAD * 2
-
-            # ---- Activity name label (left column) ----
-            lbl = QGraphicsTextItem(f"  {act.id}  {act.name}")
-            # Critical activities use a darker red text to stand out
-            if act.is_critical:
-                lbl.setDefaultTextColor(QColor("#a00000"))
-            else:
-                lbl.setDefaultTextColor(QColor(CLR_LABEL_FG))
-            lbl.setFont(font_lbl)
-            lbl.setPos(4, y + (ROW_H - 16) // 2)
-            # Clip to label column
-            lbl.setTextWidth(LABEL_W - 8)
-            self.scene.addItem(lbl)
-
-            # Skip bars if not yet scheduled (EF == 0)
-            if act.EF == 0 and act.ES == 0 and act.duration > 0 and act.LF == 0:
-                continue
-
-            # ---- Float bar (LS → LF, faded) ----
-            if act.total_float > 0:
-                fx = LABEL_W + act.LS * DAY_W
-                fw = act.total_float * DAY_W
-                float_bar = QGraphicsRectItem(fx, bar_y + 6, fw, bar_h - 12)
-                float_bar.setBrush(QBrush(QColor(CLR_BAR_FLOAT)))
-                float_bar.setPen(QPen(QColor("#a0a0a0"), 1))
-                float_bar.setZValue(1)
-                self.scene.addItem(float_bar)
-
-            # ---- Activity bar (ES → EF) ----
-            bx = LABEL_W + act.ES * DAY_W
-            bw = max(act.duration * DAY_W, 2)
-
-            if act.is_critical:
-                bar_color   = QColor(CLR_BAR_CRIT)
-                border_color = QColor(CLR_BAR_CRIT_BORDER)
-            else:
-                bar_color   = QColor(CLR_BAR_NORMAL)
-                border_color = QColor(CLR_BAR_NRM_BORDER)
-
-            bar_rect = QGraphicsRectItem(bx, bar_y, bw, bar_h)
-            bar_rect.setBrush(QBrush(bar_color))
-            bar_rect.setPen(QPen(border_color, 1.5))
-            bar_rect.setZValue(2)
-            self.scene.addItem(bar_rect)
-
-            # ---- Bar label (duration text) ----
-            if bw > 24:
-                bar_txt = QGraphicsTextItem(f"{act.duration}d")
-                bar_txt.setDefaultTextColor(QColor(CLR_BAR_TEXT))
-                bar_txt.setFont(font_bar)
-                bar_txt.setPos(bx + 4, bar_y + 4)
-                bar_txt.setZValue(3)
-                self.scene.addItem(bar_txt)
-
-        # Vertical line at day 0
-        d0_line = QGraphicsLineItem(LABEL_W, 0, LABEL_W, HEADER_H + len(activities) * ROW_H)
-        d0_line.setPen(QPen(QColor("#b0b0b0"), 2))
-        self.scene.addItem(d0_line)
@@ -7,6 +7,7 @@ Responsibilities
 ----------------
 - Bootstrap the Qt application with sensible defaults.
 - Apply a consistent font stack with cross-platform fallbacks.
+- Install the application-wide stylesheet.
 - Set application metadata used by Qt's settings / OS integration.
 - Provide a clean, informative crash handler so unhandled exceptions
   are shown to the user rather than silently terminating the process.
@@ -18,6 +19,7 @@ from __future__ import annotations
 import os
 import sys
 import traceback
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Ensure the project root is on sys.path so all relative imports resolve
@@ -31,11 +33,12 @@ if _PROJECT_ROOT not in sys.path:
 # ---------------------------------------------------------------------------
 # Qt imports — kept after sys.path fix so PySide6 can find any bundled libs
 # ---------------------------------------------------------------------------
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, QSettings, qVersion
+from PySide6.QtGui import QFont, QFontDatabase, QIcon
 from PySide6.QtWidgets import QApplication, QMessageBox
 
 from main_window import MainWindow
+from styles import APP_QSS
 
 # ---------------------------------------------------------------------------
 # Application metadata
@@ -50,6 +53,34 @@ ORGANIZATION_URL = "https://openplan.example.com"  # update when live
 # Font helpers
 # ---------------------------------------------------------------------------
 
+# Preferred UI families, best first; the last entry is Qt's generic fallback.
+_FONT_CANDIDATES = ("Segoe UI", "SF Pro Text", "Ubuntu", "Roboto", "Sans-Serif")
+
+# QSettings key for the resolved family, plus the environment it was resolved in.
+_FONT_CACHE_KEY = "startup/font_family"
+
+
+@lru_cache(maxsize=1)
+def _resolve_font_family() -> str:
+    """
+    Return the first installed family from ``_FONT_CANDIDATES``.
+
+    Enumerating the font database is slow on systems with many fonts, so the
+    result is persisted in QSettings (keyed by Qt version and platform) and
+    the enumeration only runs when that cache misses.
+    """
+    settings = QSettings()
+    env = f"{qVersion()}|{sys.platform}"
+    cached = settings.value(_FONT_CACHE_KEY)
+    if isinstance(cached, list) and len(cached) == 2 and cached[0] == env:
+        return cached[1]
+
+    available = set(QFontDatabase.families())
+    family = next((c for c in _FONT_CANDIDATES if c in available), _FONT_CANDIDATES[-1])
+    settings.setValue(_FONT_CACHE_KEY, [env, family])
+    return family
+
+
 def _build_font() -> QFont:
     """
     Return the preferred UI font with cross-platform fallbacks.
@@ -61,14 +92,9 @@ def _build_font() -> QFont:
         4. Roboto        (other Linux / Android)
         5. Sans-Serif    (Qt built-in generic fallback)
     """
-    candidates = ["Segoe UI", "SF Pro Text", "Ubuntu", "Roboto", "Sans-Serif"]
-    for family in candidates:
-        font = QFont(family, 10)
-        if font.exactMatch() or family == candidates[-1]:
-            font.setPointSize(10)
-            font.setStyleStrategy(QFont.PreferAntialias)
-            return font
-    return QFont()  # absolute fallback
+    font = QFont(_resolve_font_family(), 10)
+    font.setStyleStrategy(QFont.PreferAntialias)
+    return font
 
 
 # ---------------------------------------------------------------------------
@@ -113,6 +139,15 @@ def _excepthook(exc_type, exc_value, exc_tb) -> None:
 def _create_app() -> QApplication:
     """Initialise and configure the QApplication instance."""
 
+    # Already bootstrapped (e.g. main() invoked twice): reuse the live
+    # application rather than constructing and configuring a second one,
+    # but make sure it still carries the app-wide sheet the widgets rely on.
+    existing = QApplication.instance()
+    if existing is not None:
+        if existing.styleSheet() != APP_QSS:
+            existing.setStyleSheet(APP_QSS)
+        return existing
+
     # High-DPI support — must be set *before* QApplication is constructed.
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -129,6 +164,9 @@ def _create_app() -> QApplication:
     # Font
     app.setFont(_build_font())
 
+    # Stylesheet — one app-wide sheet, parsed once (see styles.py)
+    app.setStyleSheet(APP_QSS)
+
     # Optional: application icon (no-op if the file doesn't exist yet)
     icon_path = os.path.join(_PROJECT_ROOT, "resources", "icons", "app_icon.png")
     if os.path.isfile(icon_path):
@@ -27,30 +27,40 @@ Phase 2 additions
 
 from __future__ import annotations
 
+import copy
 import os
 from datetime import date
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from activity import Activity
-from activity_dialog import ActivityDialog
 from activity_table import ActivityTable
-from db import delete_activity, init_db, load_all_activities, save_activity, save_all_activities
+from db import (
+    delete_activity, delete_all_activities, init_db, load_all_activities,
+    replace_all_activities, save_activity, save_all_activities,
+)
 from gantt_view import GanttView
-from project_settings_dialog import ProjectSettingsDialog
 from resource_panel import ResourcePanel
-from PySide6.QtCore import QSettings, Qt
+from PySide6.QtCore import QObject, QRunnable, QSettings, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QApplication, QFileDialog, QFrame, QHBoxLayout, QLabel,
     QMainWindow, QMessageBox, QPushButton, QSplitter,
     QTabWidget, QVBoxLayout, QWidget,
 )
-from scheduler import CPMScheduler, SchedulerError
+from scheduler import CPMScheduler
 from status_panel import StatusPanel
 
+if TYPE_CHECKING:
+    # Dialogs are imported on first use (like the exporters) to keep them
+    # off the startup import path.
+    from activity_dialog import ActivityDialog
+
 # ---------------------------------------------------------------------------
 # Sample data
 # ---------------------------------------------------------------------------
+# Refresh requests within this window (about one frame) share one repaint.
+_REFRESH_COALESCE_MS = 16
+
 SAMPLE_ACTIVITIES = [
     Activity("A", "Start",      2, ()),
     Activity("B", "Foundation", 4, ("A",)),
@@ -59,6 +69,42 @@ SAMPLE_ACTIVITIES = [
     Activity("E", "Finish",     2, ("C", "D")),
 ]
 
+# CPM result fields copied from a background schedule run onto the live activities
+_CPM_FIELDS = ("ES", "EF", "LS", "LF", "total_float", "free_float", "is_critical")
+
+
+def _network_key(activities: Dict[str, Activity]) -> Dict[str, tuple]:
+    """What a CPM result depends on: every activity's duration and predecessors."""
+    return {k: (a.duration, a.predecessors) for k, a in activities.items()}
+
+
+class _ScheduleSignals(QObject):
+    # {id: scheduled Activity copy}, critical path IDs, project duration
+    finished = Signal(dict, list, int)
+    failed = Signal(str)
+
+
+class _ScheduleWorker(QRunnable):
+    """Runs `CPMScheduler` in the global thread pool, off the GUI thread."""
+
+    def __init__(self, activities: Dict[str, Activity]):
+        super().__init__()
+        # Private shallow copies: the pool thread writes CPM fields only on
+        # these, never on objects the GUI thread may be painting from.
+        self._activities = {k: copy.copy(a) for k, a in activities.items()}
+        self.signals = _ScheduleSignals()
+
+    def run(self):
+        try:
+            scheduler = CPMScheduler(self._activities)
+            scheduler.schedule()
+            critical = scheduler.get_critical_path()
+            duration = scheduler.project_duration()
+        except Exception as e:      # reported on the GUI thread
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self._activities, critical, duration)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -67,6 +113,18 @@ class MainWindow(QMainWindow):
         self._project_name: str = "My Project"
         self._start_date: Optional[date] = None
         self._calendar_type: str = "Mon-Fri"
+        # Built on first Add/Edit, then re-bound with reset() on each open
+        self._activity_dialog: Optional[ActivityDialog] = None
+        # Yes/No confirmation box, built on first use and reused by _ask()
+        self._confirm_box: Optional[QMessageBox] = None
+        # In-flight background schedule run (None when idle)
+        self._schedule_worker: Optional[_ScheduleWorker] = None
+
+        # _refresh_ui() only arms this; the views are rebuilt once when it fires.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(_REFRESH_COALESCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         init_db()
         self._settings = QSettings("OpenPlan", "Mini-P7")
@@ -101,9 +159,7 @@ class MainWindow(QMainWindow):
         root.addWidget(self._build_toolbar())
 
         splitter = QSplitter(Qt.Horizontal)
-        splitter.setStyleSheet(
-            "QSplitter::handle { background-color: #c0c0c0; width: 2px; }"
-        )
+        splitter.setObjectName("MainSplitter")     # styled by styles.APP_QSS
 
         self.activity_table = ActivityTable()
         self.activity_table.add_requested.connect(self._on_add_activity)
@@ -112,19 +168,7 @@ class MainWindow(QMainWindow):
 
         # Right side: tabbed view
         self._tabs = QTabWidget()
-        self._tabs.setStyleSheet("""
-            QTabWidget::pane { border: none; background-color: #f8f8f8; }
-            QTabBar::tab {
-                background-color: #e8e8e8; color: #505050;
-                padding: 6px 18px; border: 1px solid #c0c0c0;
-                border-bottom: none; font-size: 11px; font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #f8f8f8; color: #1e5c8a;
-                border-bottom: 2px solid #3a7ca5;
-            }
-            QTabBar::tab:hover { background-color: #d8e8f0; }
-        """)
+        self._tabs.setObjectName("MainTabs")
 
         self.gantt_view = GanttView()
         self.resource_panel = ResourcePanel()
@@ -221,80 +265,46 @@ class MainWindow(QMainWindow):
 
     def _build_titlebar(self) -> QWidget:
         bar = QFrame()
-        bar.setStyleSheet(
-            "QFrame { background-color: #e0e0e0; border-bottom: 2px solid #a0a0a0; }"
-        )
+        bar.setObjectName("TitleBar")             # styled by styles.APP_QSS
         bar.setFixedHeight(46)
         row = QHBoxLayout(bar)
         row.setContentsMargins(16, 0, 16, 0)
 
         logo = QLabel("◈")
-        logo.setStyleSheet("color: #2a7ab0; font-size: 20px;")
+        logo.setObjectName("titleLogo")
         row.addWidget(logo)
 
         title = QLabel("Mini-P7")
-        title.setStyleSheet(
-            "color: #202020; font-size: 18px; font-weight: bold;"
-            " letter-spacing: 1px; margin-left: 6px;"
-        )
+        title.setObjectName("titleMain")
         row.addWidget(title)
 
         sub = QLabel("CPM Scheduler  ·  Phase 2")
-        sub.setStyleSheet(
-            "color: #505050; font-size: 12px; margin-left: 4px; margin-top: 4px;"
-        )
+        sub.setObjectName("titleSub")
         row.addWidget(sub)
 
         row.addStretch()
 
         self._project_label = QLabel("Project: My Project")
-        self._project_label.setStyleSheet(
-            "color: #1e5c8a; font-size: 11px; font-weight: bold;"
-        )
+        self._project_label.setObjectName("titleProject")
         row.addWidget(self._project_label)
 
         row.addWidget(QLabel("  ·  "))
 
         self._date_label = QLabel("No start date set")
-        self._date_label.setStyleSheet("color: #606060; font-size: 11px;")
+        self._date_label.setObjectName("titleInfo")
         row.addWidget(self._date_label)
 
         row.addWidget(QLabel("  ·  "))
 
         hint = QLabel("Double-click row to edit  ·  F5 to schedule")
-        hint.setStyleSheet("color: #606060; font-size: 11px;")
+        hint.setObjectName("titleInfo")
         row.addWidget(hint)
 
         return bar
 
     def _build_toolbar(self) -> QWidget:
         bar = QFrame()
-        bar.setStyleSheet("""
-            QFrame { background-color: #f0f0f0; border-bottom: 1px solid #b0b0b0; }
-            QPushButton {
-                background-color: #ffffff; color: #202020;
-                border: 1px solid #b0b0b0; border-radius: 4px;
-                padding: 6px 14px; font-size: 12px; min-width: 70px;
-            }
-            QPushButton:hover { background-color: #e0e0e0; }
-            QPushButton#scheduleBtn {
-                background-color: #2a7ab0; color: #ffffff;
-                border: 1px solid #1e5a8a; font-weight: bold;
-                font-size: 13px; padding: 6px 22px;
-            }
-            QPushButton#scheduleBtn:hover { background-color: #1e6aa0; }
-            QPushButton#clearBtn:hover {
-                background-color: #f0d0d0; color: #a00000; border-color: #c06060;
-            }
-            QPushButton#exportBtn {
-                background-color: #f0f8f0; color: #2a7a2a; border: 1px solid #80b080;
-            }
-            QPushButton#exportBtn:hover { background-color: #d8f0d8; }
-            QPushButton#settingsBtn {
-                background-color: #f8f4e8; color: #7a6020; border: 1px solid #c0a840;
-            }
-            QPushButton#settingsBtn:hover { background-color: #f0e8c0; }
-        """)
+        bar.setObjectName("MainToolbar")          # styled by styles.APP_QSS
         bar.setFixedHeight(48)
         row = QHBoxLayout(bar)
         row.setContentsMargins(12, 6, 12, 6)
@@ -324,11 +334,11 @@ class MainWindow(QMainWindow):
 
         row.addSpacing(12)
 
-        schedule_btn = QPushButton(" ▶  Schedule")
-        schedule_btn.setObjectName("scheduleBtn")
-        schedule_btn.setToolTip("Run CPM forward/backward pass (F5)")
-        schedule_btn.clicked.connect(self._run_schedule)
-        row.addWidget(schedule_btn)
+        self._schedule_btn = QPushButton(" ▶  Schedule")
+        self._schedule_btn.setObjectName("scheduleBtn")
+        self._schedule_btn.setToolTip("Run CPM forward/backward pass (F5)")
+        self._schedule_btn.clicked.connect(self._run_schedule)
+        row.addWidget(self._schedule_btn)
 
         return bar
 
@@ -338,13 +348,24 @@ class MainWindow(QMainWindow):
 
     def _load_from_db(self):
         self._activities = load_all_activities()
-        self._refresh_ui()
+        self._do_refresh()      # synchronous: the first paint should show the data
         if self._activities:
             self.status_panel.set_message(
                 f"Loaded {len(self._activities)} activit(ies) from database."
             )
 
     def _refresh_ui(self):
+        """
+        Schedule a rebuild of the table, Gantt and resource views.
+
+        Calls made in quick succession (bulk edits, import + schedule)
+        collapse into a single ``_do_refresh`` on the next timer tick.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        self._refresh_timer.stop()
         self.activity_table.populate(self._activities)
         self.gantt_view.render_gantt(self._activities)
         self.resource_panel.render_resources(self._activities)
@@ -359,6 +380,7 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _show_project_settings(self):
+        from project_settings_dialog import ProjectSettingsDialog
         dlg = ProjectSettingsDialog(
             parent=self,
             project_name=self._project_name,
@@ -376,23 +398,18 @@ class MainWindow(QMainWindow):
             )
 
     def _load_sample(self):
-        reply = QMessageBox.question(
-            self, "Load Sample",
+        if not self._ask(
+            "Load Sample",
             "This will replace the current project with sample data.\nContinue?",
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
+        ):
             return
 
-        for act_id in list(self._activities.keys()):
-            delete_activity(act_id)
         self._activities.clear()
-
         for act in SAMPLE_ACTIVITIES:
             a = Activity(act.id, act.name, act.duration, act.predecessors,
                          resource=act.resource)
             self._activities[a.id] = a
-            save_activity(a)
+        replace_all_activities(self._activities)   # one transaction for the whole swap
 
         self._refresh_ui()
         self.status_panel.set_message(
@@ -402,32 +419,50 @@ class MainWindow(QMainWindow):
     def _clear_all(self):
         if not self._activities:
             return
-        reply = QMessageBox.question(
-            self, "Clear All", "Delete all activities? This cannot be undone.",
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
+        if not self._ask("Clear All", "Delete all activities? This cannot be undone."):
             return
-        for act_id in list(self._activities.keys()):
-            delete_activity(act_id)
+        delete_all_activities()
         self._activities.clear()
         self._refresh_ui()
         self.status_panel.set_message("All activities cleared.")
 
     def _run_schedule(self):
+        if self._schedule_worker is not None:
+            return      # a run is already in flight (F5 while the button is disabled)
         if not self._activities:
             self.status_panel.set_message("No activities to schedule.", error=True)
             return
-        try:
-            scheduler = CPMScheduler(self._activities)
-            scheduler.schedule()
-            save_all_activities(self._activities)
-            critical = scheduler.get_critical_path()
-            self._refresh_ui()
-            self.status_panel.update_stats(self._activities, critical)
-        except SchedulerError as e:
-            self.status_panel.set_message(str(e), error=True)
-            QMessageBox.critical(self, "Scheduling Error", str(e))
+        worker = _ScheduleWorker(self._activities)
+        worker.signals.finished.connect(self._on_schedule_done)
+        worker.signals.failed.connect(self._on_schedule_failed)
+        self._schedule_worker = worker
+        self._schedule_btn.setEnabled(False)
+        self.status_panel.set_message("Scheduling…")
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_schedule_done(
+        self, scheduled: Dict[str, Activity], critical: list, duration: int
+    ):
+        self._schedule_worker = None
+        self._schedule_btn.setEnabled(True)
+        if _network_key(scheduled) != _network_key(self._activities):
+            self.status_panel.set_message(
+                "Activities changed while scheduling. Click ▶ Schedule again.", error=True
+            )
+            return
+        for act_id, result in scheduled.items():
+            act = self._activities[act_id]
+            for name in _CPM_FIELDS:
+                setattr(act, name, getattr(result, name))
+        save_all_activities(self._activities)
+        self._refresh_ui()
+        self.status_panel.update_stats(self._activities, critical, duration)
+
+    def _on_schedule_failed(self, message: str):
+        self._schedule_worker = None
+        self._schedule_btn.setEnabled(True)
+        self.status_panel.set_message(message, error=True)
+        QMessageBox.critical(self, "Scheduling Error", message)
 
     # ---- Export ----
 
@@ -512,12 +547,9 @@ class MainWindow(QMainWindow):
         )
         if not filepath:
             return
-        reply = QMessageBox.question(
-            self, "Import P6 XML",
-            "This will replace all current activities.\nContinue?",
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
+        if not self._ask(
+            "Import P6 XML", "This will replace all current activities.\nContinue?"
+        ):
             return
         try:
             from p6_xml import import_p6_xml
@@ -526,12 +558,9 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Import",
                                     "No activities found in the XML file.")
                 return
-            for act_id in list(self._activities.keys()):
-                delete_activity(act_id)
             self._activities.clear()
-            for act in imported.values():
-                self._activities[act.id] = act
-                save_activity(act)
+            self._activities.update((act.id, act) for act in imported.values())
+            replace_all_activities(self._activities)
             self._refresh_ui()
             self.status_panel.set_message(
                 f"Imported {len(imported)} activit(ies) from "
@@ -542,8 +571,28 @@ class MainWindow(QMainWindow):
 
     # ---- CRUD ----
 
+    def _activity_dlg(self, activity: Optional[Activity] = None) -> ActivityDialog:
+        """Return the shared activity dialog, bound to *activity* (or blank)."""
+        if self._activity_dialog is None:
+            from activity_dialog import ActivityDialog
+            self._activity_dialog = ActivityDialog(parent=self)
+        self._activity_dialog.reset(activity, frozenset(self._activities))
+        return self._activity_dialog
+
+    def _ask(self, title: str, text: str) -> bool:
+        """Show the shared Yes/No confirmation box; True if the user chose Yes."""
+        box = self._confirm_box
+        if box is None:
+            box = self._confirm_box = QMessageBox(self)
+            box.setIcon(QMessageBox.Question)
+            box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+        return box.standardButton(box.clickedButton()) == QMessageBox.Yes
+
     def _on_add_activity(self):
-        dlg = ActivityDialog(parent=self, existing_ids=list(self._activities.keys()))
+        dlg = self._activity_dlg()
         if dlg.exec():
             act = dlg.get_activity()
             self._activities[act.id] = act
@@ -556,11 +605,7 @@ class MainWindow(QMainWindow):
     def _on_edit_activity(self, act_id: str):
         if act_id not in self._activities:
             return
-        dlg = ActivityDialog(
-            parent=self,
-            activity=self._activities[act_id],
-            existing_ids=list(self._activities.keys()),
-        )
+        dlg = self._activity_dlg(self._activities[act_id])
         if dlg.exec():
             updated = dlg.get_activity()
             self._activities[act_id] = updated
@@ -571,11 +616,7 @@ class MainWindow(QMainWindow):
             )
 
     def _on_delete_activity(self, act_id: str):
-        reply = QMessageBox.question(
-            self, "Delete Activity", f"Delete activity '{act_id}'?",
-            QMessageBox.Yes | QMessageBox.No,
-        )
-        if reply != QMessageBox.Yes:
+        if not self._ask("Delete Activity", f"Delete activity '{act_id}'?"):
             return
         del self._activities[act_id]
         delete_activity(act_id)
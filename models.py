@@ -1,8 +1,8 @@
 """
 Database models for Mini-P7 using SQLAlchemy + SQLite.
 """
-from sqlalchemy import Boolean, Column, Integer, String
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
@@ -14,7 +14,7 @@ class ActivityRecord(Base):
     id           = Column(String,  primary_key=True)
     name         = Column(String,  nullable=False)
     duration     = Column(Integer, nullable=False, default=0)
-    predecessors = Column(String,  default="")   # comma-separated IDs
+    predecessors = Column(String,  default="")   # legacy CSV IDs; migrated into `links` by db.init_db
     resource     = Column(String,  default="")   # FIX: was missing
     description  = Column(String,  default="")   # FIX: was missing
 
@@ -25,4 +25,27 @@ class ActivityRecord(Base):
     LF          = Column(Integer, default=0)
     total_float = Column(Integer, default=0)
     free_float  = Column(Integer, default=0)   # FIX: was missing
-    is_critical = Column(Boolean, default=False)
+    is_critical = Column(Boolean, default=False, index=True)   # ix_activities_is_critical
+
+    # Predecessors, in their original order (loaded with one extra SELECT ... IN)
+    links = relationship(
+        "PredecessorLink",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        order_by="PredecessorLink.position",
+    )
+
+
+class PredecessorLink(Base):
+    """One Finish-to-Start dependency: *pred_id* must finish before *activity_id* starts."""
+    __tablename__ = "predecessor_links"
+
+    activity_id = Column(String,  ForeignKey("activities.id", ondelete="CASCADE"), primary_key=True)
+    # Not a foreign key: activities are saved one at a time, so a successor
+    # may legitimately be written before its predecessor row exists.
+    pred_id     = Column(String,  primary_key=True)
+    position    = Column(Integer, nullable=False, default=0)   # order within the activity
+
+    __table_args__ = (
+        Index("ix_pred_pred", "pred_id"),      # "who depends on X?"
+    )
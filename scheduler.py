@@ -1,10 +1,38 @@
 """
 CPM Scheduling Engine for Mini-P6.
 Performs Forward Pass, Backward Pass, Float calculation, and Critical Path identification.
+
+The dependency graph is built once per ``schedule()`` as predecessor and
+successor CSR arrays (see activity_arrays.py); every pass then works on
+integer row indices and NumPy columns, and results are copied back onto the
+`Activity` objects in one sweep at the end.
+
+When Numba is installed the passes run as the compiled kernels in
+cpm_kernels.py.  Otherwise wide networks are scheduled level-synchronously: each topological level
+(rows whose predecessors are all in earlier levels) is one segmented
+``np.maximum.reduceat`` / ``np.minimum.reduceat`` step.  Deep, narrow
+networks (long chains) would pay NumPy call overhead per level, so they keep
+the scalar row loop.
 """
-from typing import Dict, List, Optional, Tuple
-from collections import deque
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import cpm_kernels
 from activity import Activity
+from activity_arrays import ActivityArrays, _csr_rows
+
+
+# Average rows per topological level needed before the level-synchronous
+# passes beat the scalar loop (several NumPy calls per level vs. one Python
+# iteration per row).
+_LEVEL_SYNC_MIN_WIDTH = 24
+
+# Last successful run as ``(network fingerprint, project finish, result
+# columns, critical path)``.  Re-scheduling an unchanged network restores it
+# instead of recomputing (see `CPMScheduler._fingerprint`).
+_last_result: Optional[Tuple[tuple, int, tuple, List[str]]] = None
 
 
 class SchedulerError(Exception):
@@ -16,7 +44,7 @@ class CPMScheduler:
     Critical Path Method engine.
 
     Algorithm:
-    1. Build a directed graph from activity dependencies
+    1. Build a directed graph from activity dependencies (CSR, built once)
     2. Topological sort (Kahn's algorithm)
     3. Forward pass  → compute ES / EF
     4. Backward pass → compute LS / LF
@@ -26,6 +54,12 @@ class CPMScheduler:
 
     def __init__(self, activities: Dict[str, Activity]):
         self.activities = activities  # {id: Activity}
+        self._project_finish: Optional[int] = None   # set by the forward pass
+        self._table: Optional[ActivityArrays] = None  # graph of the last computed run
+        # True only after a full schedule() completed on self._table; the
+        # graph and columns are then safe for schedule_incremental() to reuse.
+        self._scheduled = False
+        self._critical_path: Optional[List[str]] = None  # set by _compute_float
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -33,101 +67,245 @@ class CPMScheduler:
 
     def schedule(self) -> List[Activity]:
         """Run full CPM and return activities with all fields populated."""
+        global _last_result
         if not self.activities:
             return []
 
-        self._validate()
-        order = self._topological_sort()
-        self._forward_pass(order)
-        self._backward_pass(order)
+        fingerprint = self._fingerprint()
+        cached = _last_result
+        if cached is not None and cached[0] == fingerprint:
+            self._scheduled = False     # no graph for schedule_incremental()
+            self._project_finish = cached[1]
+            self._critical_path = cached[3]
+            self._write_back(cached[2])
+            return list(self.activities.values())
+
+        order, level_off = self._prepare()
+        self._forward_pass(order, level_off)
+        self._backward_pass(order, level_off)
+        self._compute_float()
+        columns = self._result_columns()
+        self._write_back(columns)
+
+        _last_result = (fingerprint, self._project_finish, columns, self._critical_path)
+        self._scheduled = True
+        return list(self.activities.values())
+
+    def schedule_incremental(self, changed_ids: Iterable[str]) -> List[Activity]:
+        """
+        Re-run CPM after the durations of *changed_ids* were edited.
+
+        Reuses the graph from the previous `schedule()` on this scheduler:
+        the forward pass is repeated only for the changed activities and their
+        descendants, the backward pass only for them and their ancestors (or
+        for every row if the project finish moved), and only activities whose
+        results changed are written back.  Falls back to a full `schedule()`
+        when there is no completed previous run or the network's ids or
+        predecessors changed.
+        """
+        t = self._table
+        if not self._scheduled or list(self.activities) != t.ids:
+            return self.schedule()
+        rows = []
+        for act_id in changed_ids:
+            i = t.index_of(act_id)
+            act = self.activities[act_id]
+            if act.predecessors != t.predecessors_of(i):
+                return self.schedule()
+            self._acts[i] = act
+            t.duration[i] = act.duration
+            rows.append(i)
+        if not rows:
+            return list(self.activities.values())
+        rows = np.array(rows, dtype=np.int32)
+
+        before = self._result_arrays()
+        n, order = len(t), self._order
+        stack = np.empty(n, dtype=np.int32)
+
+        forward = np.zeros(n, dtype=np.bool_)
+        cpm_kernels.mark_reachable(rows, t.succ_idx, t.succ_off, forward, stack)
+        cpm_kernels.forward_pass(
+            order[forward[order]], t.duration, t.ES, t.EF, t.pred_idx, t.pred_off
+        )
+
+        old_finish = self._project_finish
+        self._project_finish = int(t.EF.max())
+        if self._project_finish == old_finish:
+            backward = np.zeros(n, dtype=np.bool_)
+            cpm_kernels.mark_reachable(rows, t.pred_idx, t.pred_off, backward, stack)
+            # Free float (fused into the backward pass) also changes for rows
+            # whose EF or whose successors' ES moved.
+            backward |= forward
+            backward[_csr_rows(t.pred_off, t.pred_idx, np.flatnonzero(forward))[0]] = True
+            backward_order = order[backward[order]]
+        else:
+            backward_order = order      # every sink's LF moves with the finish
+        cpm_kernels.backward_pass(
+            backward_order, t.duration, t.ES, t.EF, t.LS, t.LF, t.free_float,
+            t.succ_idx, t.succ_off, self._project_finish,
+        )
         self._compute_float()
 
+        after = self._result_arrays()
+        dirty = np.zeros(n, dtype=np.bool_)
+        for old, new in zip(before, after):
+            dirty |= old != new
+        for i in np.flatnonzero(dirty).tolist():
+            act = self._acts[i]
+            act.ES, act.EF, act.LS, act.LF = (
+                int(t.ES[i]), int(t.EF[i]), int(t.LS[i]), int(t.LF[i])
+            )
+            act.total_float, act.free_float = int(t.total_float[i]), int(t.free_float[i])
+            act.is_critical = bool(t.is_critical[i])
         return list(self.activities.values())
 
+    def _prepare(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Validate, build the graph and sort it; returns ``(order, level_off)``."""
+        self._scheduled = False
+        self._validate()
+        self._build_graph()
+        order, level_off = self._topological_sort()
+        self._order = order
+        self._level_sync = len(order) >= _LEVEL_SYNC_MIN_WIDTH * (len(level_off) - 1)
+        return order, level_off
+
+    def _fingerprint(self) -> tuple:
+        """Everything a CPM result depends on: ids, durations and predecessors, in row order."""
+        return tuple(
+            (act_id, act.duration, act.predecessors)
+            for act_id, act in self.activities.items()
+        )
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
 
     def _validate(self):
+        # Common case: one C-level subset test over every referenced id.
+        ids = self.activities.keys()
+        if ids >= set(chain.from_iterable(a.predecessors for a in self.activities.values())):
+            return
+        # Otherwise locate the first offender for the error message.
         for act_id, act in self.activities.items():
             for pred_id in act.predecessors:
-                if pred_id not in self.activities:
+                if pred_id not in ids:
                     raise SchedulerError(
                         f"Activity '{act_id}' references unknown predecessor '{pred_id}'"
                     )
 
     # ------------------------------------------------------------------
-    # Topological sort (Kahn's BFS)
+    # Graph construction
     # ------------------------------------------------------------------
 
-    def _topological_sort(self) -> List[str]:
-        in_degree: Dict[str, int] = {aid: 0 for aid in self.activities}
-        successors: Dict[str, List[str]] = {aid: [] for aid in self.activities}
+    def _build_graph(self):
+        """Give every activity a row index and build both CSR adjacency arrays."""
+        self._acts = list(self.activities.values())
+        self._table = ActivityArrays.from_activities(self._acts)
+        self._table.build_csr()
 
-        for act_id, act in self.activities.items():
-            for pred_id in act.predecessors:
-                successors[pred_id].append(act_id)
-                in_degree[act_id] += 1
-
-        # Start with activities that have no predecessors
-        queue = deque(aid for aid, deg in in_degree.items() if deg == 0)
-        order: List[str] = []
-
-        while queue:
-            current = queue.popleft()
-            order.append(current)
-            for succ in successors[current]:
-                in_degree[succ] -= 1
-                if in_degree[succ] == 0:
-                    queue.append(succ)
-
-        if len(order) != len(self.activities):
+    # ------------------------------------------------------------------
+    # Topological sort (Kahn's BFS)
+    # ------------------------------------------------------------------
+
+    def _topological_sort(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(order, level_off)``, see `ActivityArrays.topological_levels`."""
+        try:
+            return self._table.topological_levels()
+        except ValueError:
             raise SchedulerError(
                 "Circular dependency detected in activity network. "
                 "Please check predecessor relationships."
-            )
-
-        return order
+            ) from None
 
     # ------------------------------------------------------------------
     # Forward pass: compute ES and EF
     # ------------------------------------------------------------------
 
-    def _forward_pass(self, order: List[str]):
-        for act_id in order:
-            act = self.activities[act_id]
-            if not act.predecessors:
-                act.ES = 0
-            else:
-                act.ES = max(
-                    self.activities[pred_id].EF for pred_id in act.predecessors
-                )
-            act.EF = act.ES + act.duration
+    def _forward_pass(self, order: np.ndarray, level_off: np.ndarray):
+        t = self._table
+        if cpm_kernels.HAVE_NUMBA:
+            cpm_kernels.forward_pass(order, t.duration, t.ES, t.EF, t.pred_idx, t.pred_off)
+        elif self._level_sync:
+            ES, EF, duration = t.ES, t.EF, t.duration
+            ES[:] = 0                   # level 0: no predecessors
+            level0 = order[:level_off[1]]
+            EF[level0] = duration[level0]
+            for k in range(1, len(level_off) - 1):
+                rows = order[level_off[k]:level_off[k + 1]]
+                preds, starts = _csr_rows(t.pred_off, t.pred_idx, rows)
+                es = np.maximum.reduceat(EF[preds], starts)
+                ES[rows] = es
+                EF[rows] = es + duration[rows]
+        else:
+            duration = t.duration.tolist()
+            pred_idx, pred_off = t.pred_idx.tolist(), t.pred_off.tolist()
+            # Level 0 holds exactly the rows without predecessors: ES = 0 and
+            # EF = duration, so the loop below only visits rows that have some.
+            ES = [0] * len(t)
+            EF = duration.copy()
+            for i in order[level_off[1]:].tolist():
+                es = max([EF[p] for p in pred_idx[pred_off[i]:pred_off[i + 1]]])
+                ES[i] = es
+                EF[i] = es + duration[i]
+            t.ES[:] = ES
+            t.EF[:] = EF
+
+        # Project finish = maximum EF; reused by the backward pass, free float
+        # and project_duration()
+        self._project_finish = int(t.EF.max())
 
     # ------------------------------------------------------------------
-    # Backward pass: compute LS and LF
+    # Backward pass: compute LS and LF (and free float)
     # ------------------------------------------------------------------
 
-    def _backward_pass(self, order: List[str]):
-        # Project finish = maximum EF across all activities
-        project_finish = max(act.EF for act in self.activities.values())
-
-        # Build successor map
-        successors: Dict[str, List[str]] = {aid: [] for aid in self.activities}
-        for act_id, act in self.activities.items():
-            for pred_id in act.predecessors:
-                successors[pred_id].append(act_id)
+    def _backward_pass(self, order: np.ndarray, level_off: np.ndarray):
+        """
+        LS / LF, plus free float from the same successor walk:
+        FF = min(successor ES) - EF, or project_finish - EF for terminal activities.
+        """
+        t = self._table
+        project_finish = self._project_finish
 
+        if cpm_kernels.HAVE_NUMBA:
+            cpm_kernels.backward_pass(
+                order, t.duration, t.ES, t.EF, t.LS, t.LF, t.free_float,
+                t.succ_idx, t.succ_off, project_finish,
+            )
+            return
+
+        if self._level_sync:
+            ES, LS, LF, FF, duration = t.ES, t.LS, t.LF, t.free_float, t.duration
+            LF[:] = project_finish      # rows without successors keep these
+            FF[:] = project_finish
+            has_succ = np.diff(t.succ_off) > 0
+            for k in range(len(level_off) - 2, -1, -1):
+                rows = order[level_off[k]:level_off[k + 1]]
+                inner = rows[has_succ[rows]]
+                if inner.size:
+                    succs, starts = _csr_rows(t.succ_off, t.succ_idx, inner)
+                    LF[inner] = np.minimum.reduceat(LS[succs], starts)
+                    FF[inner] = np.minimum.reduceat(ES[succs], starts)
+                LS[rows] = LF[rows] - duration[rows]
+            FF -= t.EF
+            return
+
+        duration = t.duration.tolist()
+        ES, EF = t.ES.tolist(), t.EF.tolist()
+        succ_idx, succ_off = t.succ_idx.tolist(), t.succ_off.tolist()
+        LS = [0] * len(t)
+        LF = [0] * len(t)
+        FF = [0] * len(t)
         # Process in reverse topological order
-        for act_id in reversed(order):
-            act = self.activities[act_id]
-            if not successors[act_id]:
-                act.LF = project_finish
-            else:
-                act.LF = min(
-                    self.activities[succ_id].LS for succ_id in successors[act_id]
-                )
-            act.LS = act.LF - act.duration
+        for i in reversed(order.tolist()):
+            succs = succ_idx[succ_off[i]:succ_off[i + 1]]
+            lf = min([LS[s] for s in succs], default=project_finish)
+            LF[i] = lf
+            LS[i] = lf - duration[i]
+            FF[i] = min([ES[s] for s in succs], default=project_finish) - EF[i]
+        t.LS[:] = LS
+        t.LF[:] = LF
+        t.free_float[:] = FF
 
     # ------------------------------------------------------------------
     # Float and critical path
@@ -139,27 +317,37 @@ class CPMScheduler:
 
         Total Float  = LS - ES  (slack without delaying project end)
         Free Float   = ES_of_earliest_successor - EF  (slack without delaying any successor)
-        """
-        # Build successor map needed for free float
-        successors: Dict[str, List[str]] = {aid: [] for aid in self.activities}
-        for act_id, act in self.activities.items():
-            for pred_id in act.predecessors:
-                successors[pred_id].append(act_id)
-
-        project_finish = max(act.EF for act in self.activities.values())
 
-        for act_id, act in self.activities.items():
-            act.total_float = act.LS - act.ES
-            act.is_critical = act.total_float == 0
-
-            # Free float: min(successor ES) - EF, or project_finish - EF for terminal activities
-            succ_ids = successors[act_id]
-            if succ_ids:
-                act.free_float = min(
-                    self.activities[s].ES for s in succ_ids
-                ) - act.EF
-            else:
-                act.free_float = project_finish - act.EF
+        Free float is filled in by the backward pass, which already walks
+        every successor edge; only total float and the critical flag remain.
+        The critical path is collected here from the flag column.
+        """
+        t = self._table
+        t.compute_floats_all()
+        ids = t.ids
+        self._critical_path = [ids[i] for i in np.flatnonzero(t.is_critical).tolist()]
+
+    def _result_arrays(self) -> tuple:
+        """Copies of the computed columns (to diff against after an update)."""
+        t = self._table
+        return (
+            t.ES.copy(), t.EF.copy(), t.LS.copy(), t.LF.copy(),
+            t.total_float.copy(), t.free_float.copy(), t.is_critical.copy(),
+        )
+
+    def _result_columns(self) -> tuple:
+        """The computed columns as plain int / bool lists, in row order."""
+        t = self._table
+        return (
+            t.ES.tolist(), t.EF.tolist(), t.LS.tolist(), t.LF.tolist(),
+            t.total_float.tolist(), t.free_float.tolist(), t.is_critical.tolist(),
+        )
+
+    def _write_back(self, columns: tuple):
+        """Copy result columns (see `_result_columns`) onto the `Activity` objects."""
+        for act, es, ef, ls, lf, tf, ff, crit in zip(self.activities.values(), *columns):
+            act.ES, act.EF, act.LS, act.LF = es, ef, ls, lf
+            act.total_float, act.free_float, act.is_critical = tf, ff, crit
 
     # ------------------------------------------------------------------
     # Utility helpers
@@ -167,6 +355,8 @@ class CPMScheduler:
 
     def get_critical_path(self) -> List[str]:
         """Return IDs of critical activities in order."""
+        if self._critical_path is not None:
+            return list(self._critical_path)
         return [
             act_id
             for act_id, act in self.activities.items()
@@ -174,6 +364,19 @@ class CPMScheduler:
         ]
 
     def project_duration(self) -> int:
+        """
+        Project makespan.
+
+        Before `schedule()` has run this needs only the forward pass (or the
+        last cached result for the same network); nothing is written back to
+        the activities.
+        """
         if not self.activities:
             return 0
-        return max(act.EF for act in self.activities.values())
+        if self._project_finish is None:
+            cached = _last_result
+            if cached is not None and cached[0] == self._fingerprint():
+                self._project_finish = cached[1]
+            else:
+                self._forward_pass(*self._prepare())
+        return self._project_finish
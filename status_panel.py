@@ -3,17 +3,23 @@ Status and project summary panel shown at the bottom of the window.
 Advanced professional light theme with subtle shadows and refined styling.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from activity import Activity
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPalette
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel
 
+# Critical-path ids shown at each end of the status bar preview; longer paths
+# are elided in the middle and shown in full in the tooltip.
+_CP_PREVIEW = 4
+
 
 class StatusPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # (count, duration, critical ids) last shown by update_stats
+        self._last_stats: Optional[Tuple[int, int, Tuple[str, ...]]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -48,6 +54,11 @@ class StatusPanel(QFrame):
                 padding: 4px 12px;
                 border-radius: 12px;
             }
+            QLabel#status_label[err="true"] {
+                color: #b03040;
+                background-color: #ffe0e0;
+                font-weight: 600;
+            }
         """)
 
         self.setFixedHeight(40)  # Slightly taller for better presence
@@ -90,17 +101,58 @@ class StatusPanel(QFrame):
         lbl.style().polish(lbl)
         return lbl
 
-    def update_stats(self, activities: Dict[str, Activity], critical_ids: List[str]):
+    def update_stats(
+        self,
+        activities: Dict[str, Activity],
+        critical_ids: List[str],
+        duration: Optional[int] = None,
+    ):
+        """
+        Show activity count, project duration and critical path.
+
+        *duration* is the scheduler's project finish (``project_duration()``);
+        when omitted it is recomputed from the activities' EF values.
+        """
         n = len(activities)
+        if duration is None:
+            duration = max((a.EF for a in activities.values()), default=0)
+        key = (n, duration, tuple(critical_ids))
+        if key == self._last_stats:
+            # Same figures as already shown: skip rebuilding the label strings
+            self.lbl_status.setText(
+                "CPM schedule computed successfully." if n else "No activities yet."
+            )
+            return
+        self._last_stats = key
+
+        # All four labels change together: suspend repaints so the panel is
+        # painted once for the whole update rather than per setText().
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_stats(n, duration, critical_ids)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_stats(self, n: int, dur: int, critical_ids: List[str]):
         if n == 0:
             self.lbl_total.setText("Activities: 0")
             self.lbl_duration.setText("Project Duration: —")
             self.lbl_critical.setText("Critical Path: —")
+            self.lbl_critical.setToolTip("")
             self.lbl_status.setText("No activities yet.")
             return
 
-        dur = max((a.EF for a in activities.values()), default=0)
-        cp_str = " → ".join(critical_ids) if critical_ids else "none"
+        if len(critical_ids) > 2 * _CP_PREVIEW:
+            hidden = len(critical_ids) - 2 * _CP_PREVIEW
+            cp_str = (
+                " → ".join(critical_ids[:_CP_PREVIEW])
+                + f" … (+{hidden}) … "
+                + " → ".join(critical_ids[-_CP_PREVIEW:])
+            )
+            self.lbl_critical.setToolTip(" → ".join(critical_ids))
+        else:
+            cp_str = " → ".join(critical_ids) if critical_ids else "none"
+            self.lbl_critical.setToolTip("")
 
         self.lbl_total.setText(f"Activities: {n}")
         self.lbl_duration.setText(f"Project Duration: {dur} days")
@@ -108,19 +160,11 @@ class StatusPanel(QFrame):
         self.lbl_status.setText("CPM schedule computed successfully.")
 
     def set_message(self, msg: str, error: bool = False):
-        if error:
-            self.lbl_status.setStyleSheet("""
-                QLabel#status_label {
-                    color: #b03040;
-                    background-color: #ffe0e0;
-                    font-weight: 600;
-                }
-            """)
-        else:
-            self.lbl_status.setStyleSheet("""
-                QLabel#status_label {
-                    color: #202020;
-                    background-color: #f0f0f0;
-                }
-            """)
-        self.lbl_status.setText(msg)
+        lbl = self.lbl_status
+        # Error styling is a dynamic property matched by the panel stylesheet;
+        # re-polish only when it actually flips.
+        if bool(lbl.property("err")) != error:
+            lbl.setProperty("err", error)
+            lbl.style().unpolish(lbl)
+            lbl.style().polish(lbl)
+        lbl.setText(msg)
@@ -0,0 +1,354 @@
+"""
+Application-wide Qt stylesheet for Mini-P7.
+
+All widget styling that used to be set per widget with ``setStyleSheet`` is
+collected here into a single ``APP_QSS`` string, applied once on the
+QApplication in ``main._create_app``.  Qt then parses the sheet a single
+time instead of once per widget (and once per dialog opened).
+
+Every rule is scoped by object name, so each section only reaches the
+widget it was written for:
+
+    QDialog#ActivityDialog   → activity_dialog.ActivityDialog
+    #ActivityTable           → activity_table.ActivityTable (+ its toolbar)
+    #GanttView               → gantt_view.GanttView (+ toolbar and canvas)
+    #TitleBar, #MainToolbar,
+    #MainSplitter, #MainTabs → main_window.MainWindow chrome
+
+Colour values mirror the ``CLR_*`` constants of the corresponding module.
+"""
+from typing import Final
+
+
+# ================== ACTIVITY DIALOG (light theme) ==================
+_DIALOG_QSS: Final[str] = """
+QDialog#ActivityDialog {
+    background-color: #f8f8f8;
+    color: #202020;
+}
+
+/* ── Labels ── */
+QDialog#ActivityDialog QLabel {
+    color: #404040;
+    font-size: 12px;
+}
+QDialog#ActivityDialog QLabel#title_label {
+    color: #1e5c8a;
+    font-size: 16px;
+    font-weight: bold;
+}
+QDialog#ActivityDialog QLabel#section_label {
+    color: #606060;
+    font-size: 11px;
+    font-weight: bold;
+    letter-spacing: 1px;
+    text-transform: uppercase;
+}
+QDialog#ActivityDialog QLabel#hint_label {
+    color: #808080;
+    font-size: 11px;
+    font-style: italic;
+}
+QDialog#ActivityDialog QLabel#error_label {
+    color: #c04040;
+    font-size: 12px;
+    background-color: #ffe0e0;
+    border: 1px solid #c04040;
+    border-radius: 4px;
+    padding: 5px 8px;
+}
+QDialog#ActivityDialog QLabel#success_label {
+    color: #2a7a2a;
+    font-size: 12px;
+}
+
+/* ── Inputs ── */
+QDialog#ActivityDialog QLineEdit, QDialog#ActivityDialog QSpinBox {
+    background-color: #ffffff;
+    color: #202020;
+    border: 1px solid #c0c0c0;
+    border-radius: 4px;
+    padding: 6px 10px;
+    font-size: 13px;
+    min-height: 28px;
+}
+QDialog#ActivityDialog QLineEdit:focus, QDialog#ActivityDialog QSpinBox:focus {
+    border: 1px solid #3a7ca5;
+    background-color: #f0f8ff;
+}
+QDialog#ActivityDialog QLineEdit:hover, QDialog#ActivityDialog QSpinBox:hover {
+    border: 1px solid #a0a0a0;
+}
+QDialog#ActivityDialog QLineEdit[readOnly="true"] {
+    background-color: #f0f0f0;
+    color: #808080;
+    border: 1px solid #d0d0d0;
+}
+QDialog#ActivityDialog QLineEdit[valid="false"] {
+    border: 1px solid #c04040;
+    background-color: #fff0f0;
+}
+QDialog#ActivityDialog QLineEdit[valid="true"] {
+    border: 1px solid #2a7a2a;
+}
+
+/* ── Buttons ── */
+QDialog#ActivityDialog QPushButton {
+    background-color: #ffffff;
+    color: #404040;
+    border: 1px solid #c0c0c0;
+    border-radius: 4px;
+    padding: 7px 18px;
+    font-size: 12px;
+    min-width: 80px;
+}
+QDialog#ActivityDialog QPushButton:hover {
+    background-color: #e0e0e0;
+}
+QDialog#ActivityDialog QPushButton:pressed {
+    background-color: #d0d0d0;
+}
+QDialog#ActivityDialog QPushButton[accent="true"] {
+    background-color: #3a7ca5;
+    color: #ffffff;
+    border: 1px solid #2a5a80;
+    font-weight: bold;
+}
+QDialog#ActivityDialog QPushButton[accent="true"]:hover {
+    background-color: #2a6a90;
+}
+QDialog#ActivityDialog QPushButton[accent="true"]:pressed {
+    background-color: #1e5a80;
+}
+QDialog#ActivityDialog QPushButton[accent="true"]:disabled {
+    background-color: #e0e0e0;
+    color: #a0a0a0;
+    border: 1px solid #d0d0d0;
+}
+
+/* ── Divider ── */
+QDialog#ActivityDialog QFrame[frameShape="4"],   /* HLine */
+QDialog#ActivityDialog QFrame[frameShape="5"] {  /* VLine */
+    color: #d0d0d0;
+    background-color: #d0d0d0;
+    max-height: 1px;
+}
+"""
+
+# ================== ACTIVITY TABLE (dark theme) ==================
+_TABLE_QSS: Final[str] = """
+#ActivityTable, #ActivityTable QWidget { background-color: #1e2530; }
+#ActivityTable QTableView {
+    background-color: #1e2530;
+    color: #c8d8e8;
+    gridline-color: #2a3545;
+    border: none;
+    font-size: 12px;
+    selection-background-color: #1e4a6a;
+}
+#ActivityTable QHeaderView::section {
+    background-color: #151c26;
+    color: #6a8fae;
+    padding: 5px 8px;
+    border: none;
+    border-right: 1px solid #2a3545;
+    border-bottom: 2px solid #2a3545;
+    font-size: 11px;
+    font-weight: bold;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+#ActivityTable QScrollBar:vertical {
+    background: #1a2230;
+    width: 10px;
+    border-radius: 5px;
+}
+#ActivityTable QScrollBar::handle:vertical {
+    background: #3a4a5a;
+    border-radius: 5px;
+}
+
+/* ── Toolbar ── */
+QFrame#ActivityTableToolbar, QFrame#ActivityTableToolbar QFrame {
+    background-color: #161e2a;
+    border-bottom: 1px solid #2a3545;
+}
+QFrame#ActivityTableToolbar QLabel#ActivityTableTitle {
+    color: #4a6a8a;
+    font-size: 10px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+QFrame#ActivityTableToolbar QPushButton {
+    background-color: transparent;
+    color: #6a8fae;
+    border: 1px solid #2a3545;
+    border-radius: 4px;
+    padding: 5px 14px;
+    font-size: 12px;
+}
+QFrame#ActivityTableToolbar QPushButton:hover {
+    background-color: #252f3d;
+    color: #90b8d8;
+}
+QFrame#ActivityTableToolbar QPushButton#addBtn {
+    background-color: #1e4a6a;
+    color: #90d0f8;
+    border: 1px solid #2a6a98;
+}
+QFrame#ActivityTableToolbar QPushButton#addBtn:hover {
+    background-color: #255878;
+}
+QFrame#ActivityTableToolbar QPushButton#deleteBtn:hover {
+    background-color: #3d1e22;
+    color: #e05060;
+    border-color: #6a2030;
+}
+"""
+
+# ================== GANTT VIEW (light theme) ==================
+_GANTT_QSS: Final[str] = """
+#GanttView, #GanttView QWidget { background-color: #f8f8f8; }
+
+/* ── Toolbar strip ── */
+QFrame#GanttToolbar, QFrame#GanttToolbar QFrame {
+    background-color: #e8e8e8;
+    border-bottom: 1px solid #c0c0c0;
+}
+QFrame#GanttToolbar QLabel {
+    color: #404040;
+    font-size: 10px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+QFrame#GanttToolbar QLabel#GanttLegendCrit {
+    color: #c04040;
+    font-size: 11px;
+}
+QFrame#GanttToolbar QLabel#GanttLegendNormal {
+    color: #3a7ca5;
+    font-size: 11px;
+    margin-left: 10px;
+}
+
+/* ── Canvas ── */
+QGraphicsView#GanttCanvas {
+    background-color: #f8f8f8;
+    border: none;
+}
+QGraphicsView#GanttCanvas QScrollBar:horizontal,
+QGraphicsView#GanttCanvas QScrollBar:vertical {
+    background: #e0e0e0;
+    height: 10px; width: 10px;
+    border-radius: 5px;
+}
+QGraphicsView#GanttCanvas QScrollBar::handle:horizontal,
+QGraphicsView#GanttCanvas QScrollBar::handle:vertical {
+    background: #a0a0a0;
+    border-radius: 5px;
+}
+"""
+
+# ================== MAIN WINDOW CHROME (light theme) ==================
+_MAIN_WINDOW_QSS: Final[str] = """
+/* ── Title bar ── */
+QFrame#TitleBar, QFrame#TitleBar QFrame {
+    background-color: #e0e0e0;
+    border-bottom: 2px solid #a0a0a0;
+}
+QFrame#TitleBar QLabel#titleLogo {
+    color: #2a7ab0;
+    font-size: 20px;
+}
+QFrame#TitleBar QLabel#titleMain {
+    color: #202020;
+    font-size: 18px;
+    font-weight: bold;
+    letter-spacing: 1px;
+    margin-left: 6px;
+}
+QFrame#TitleBar QLabel#titleSub {
+    color: #505050;
+    font-size: 12px;
+    margin-left: 4px;
+    margin-top: 4px;
+}
+QFrame#TitleBar QLabel#titleProject {
+    color: #1e5c8a;
+    font-size: 11px;
+    font-weight: bold;
+}
+QFrame#TitleBar QLabel#titleInfo {
+    color: #606060;
+    font-size: 11px;
+}
+
+/* ── Toolbar ── */
+QFrame#MainToolbar, QFrame#MainToolbar QFrame {
+    background-color: #f0f0f0;
+    border-bottom: 1px solid #b0b0b0;
+}
+QFrame#MainToolbar QPushButton {
+    background-color: #ffffff;
+    color: #202020;
+    border: 1px solid #b0b0b0;
+    border-radius: 4px;
+    padding: 6px 14px;
+    font-size: 12px;
+    min-width: 70px;
+}
+QFrame#MainToolbar QPushButton:hover { background-color: #e0e0e0; }
+QFrame#MainToolbar QPushButton#scheduleBtn {
+    background-color: #2a7ab0;
+    color: #ffffff;
+    border: 1px solid #1e5a8a;
+    font-weight: bold;
+    font-size: 13px;
+    padding: 6px 22px;
+}
+QFrame#MainToolbar QPushButton#scheduleBtn:hover { background-color: #1e6aa0; }
+QFrame#MainToolbar QPushButton#clearBtn:hover {
+    background-color: #f0d0d0;
+    color: #a00000;
+    border-color: #c06060;
+}
+QFrame#MainToolbar QPushButton#exportBtn {
+    background-color: #f0f8f0;
+    color: #2a7a2a;
+    border: 1px solid #80b080;
+}
+QFrame#MainToolbar QPushButton#exportBtn:hover { background-color: #d8f0d8; }
+QFrame#MainToolbar QPushButton#settingsBtn {
+    background-color: #f8f4e8;
+    color: #7a6020;
+    border: 1px solid #c0a840;
+}
+QFrame#MainToolbar QPushButton#settingsBtn:hover { background-color: #f0e8c0; }
+
+/* ── Splitter and right-hand tabs ── */
+QSplitter#MainSplitter::handle {
+    background-color: #c0c0c0;
+    width: 2px;
+}
+QTabWidget#MainTabs::pane {
+    border: none;
+    background-color: #f8f8f8;
+}
+QTabWidget#MainTabs QTabBar::tab {
+    background-color: #e8e8e8;
+    color: #505050;
+    padding: 6px 18px;
+    border: 1px solid #c0c0c0;
+    border-bottom: none;
+    font-size: 11px;
+    font-weight: bold;
+}
+QTabWidget#MainTabs QTabBar::tab:selected {
+    background-color: #f8f8f8;
+    color: #1e5c8a;
+    border-bottom: 2px solid #3a7ca5;
+}
+QTabWidget#MainTabs QTabBar::tab:hover { background-color: #d8e8f0; }
+"""
+
+APP_QSS: Final[str] = _DIALOG_QSS + _TABLE_QSS + _GANTT_QSS + _MAIN_WINDOW_QSS
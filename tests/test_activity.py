@@ -0,0 +1,23 @@
+"""Tests for activity.py."""
+
+import pytest
+
+import activity
+from activity import Activity
+
+
+def test_json_fallback_matches_orjson(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    act = Activity("A1", "Bétonnage – phase 1", 3, ("A0",))
+    expected = orjson.dumps(act.to_dict()).decode()
+
+    monkeypatch.setattr(activity, "_orjson", lambda: None)
+    assert act.to_json() == expected
+
+
+def test_subclass_instances_compare_by_id():
+    class Milestone(Activity):
+        __slots__ = ()
+
+    assert Milestone("A1", "Handover", 0) == Activity("A1", "Other", 2)
+    assert Activity("A1", "x", 1) != Milestone("A2", "x", 1)
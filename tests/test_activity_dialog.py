@@ -0,0 +1,64 @@
+"""Behaviour tests for the inline error banner in activity_dialog.py."""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from activity import Activity
+from activity_dialog import _CLEAR_DEBOUNCE_MS, ActivityDialog
+from styles import APP_QSS
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_failed_accept_error_survives_pending_clear(app):
+    dlg = ActivityDialog(existing_ids=["A"])
+    dlg.show()
+
+    # Editing a field arms the debounced clear; OK follows before it fires.
+    dlg._name_edit.setText("Design")
+    assert dlg._clear_timer.isActive()
+    dlg._on_accept()                    # fails: the ID is empty
+    assert dlg._error_lbl.isVisible()
+
+    QTest.qWait(2 * _CLEAR_DEBOUNCE_MS)
+    assert dlg._error_lbl.isVisible()
+    dlg.close()
+
+
+def _id_field_colour(dlg):
+    dlg._id_edit.repaint()
+    img = dlg._id_edit.grab().toImage()
+    # Sample right of any text, inside the border
+    return img.pixelColor(img.width() - 8, img.height() // 2).name()
+
+
+def test_reused_dialog_repaints_id_field_for_mode(app):
+    app.setStyleSheet(APP_QSS)
+    try:
+        fresh_add = ActivityDialog()
+        fresh_add.show()
+        fresh_edit = ActivityDialog(activity=Activity("A", "a", 1))
+        fresh_edit.show()
+        add_colour = _id_field_colour(fresh_add)
+        edit_colour = _id_field_colour(fresh_edit)
+        assert add_colour != edit_colour
+
+        dlg = ActivityDialog()
+        dlg.show()
+        dlg.reset(Activity("A", "a", 1), ["A"])
+        assert _id_field_colour(dlg) == edit_colour
+        dlg.reset(None, ["A"])
+        assert _id_field_colour(dlg) == add_colour
+
+        for d in (fresh_add, fresh_edit, dlg):
+            d.close()
+    finally:
+        app.setStyleSheet("")
@@ -0,0 +1,50 @@
+"""Round-trip tests for the predecessor link table in db.py."""
+
+from sqlalchemy import update
+
+import db
+from activity import Activity, _parse_predecessors
+from models import ActivityRecord
+
+
+def _init(tmp_path):
+    db.init_db(str(tmp_path / "test.db"))
+
+
+def test_duplicate_predecessors_collapse_on_construction():
+    act = Activity("B", "b", 1, ("A", "C", "A"))
+    assert act.predecessors == ("A", "C")
+    assert _parse_predecessors("A, A,C") == ("A", "C")
+
+
+def test_save_all_and_reload_duplicate_predecessors(tmp_path):
+    _init(tmp_path)
+    acts = {
+        "A": Activity("A", "a", 2),
+        "B": Activity("B", "b", 1, ("A", "A")),
+    }
+    db.save_all_activities(acts)
+    db.replace_all_activities(acts)
+
+    loaded = db.load_all_activities()
+    assert loaded["B"].predecessors == ("A",)
+
+
+def test_save_activity_and_reload_duplicate_predecessors(tmp_path):
+    _init(tmp_path)
+    db.save_activity(Activity("A", "a", 2))
+    db.save_activity(Activity("B", "b", 1, ("A", "A")))
+
+    assert db.load_all_activities()["B"].predecessors == ("A",)
+
+
+def test_legacy_csv_duplicates_migrate(tmp_path):
+    _init(tmp_path)
+    db.save_all_activities({"A": Activity("A", "a", 2), "B": Activity("B", "b", 1)})
+    with db.session_scope() as session:
+        session.execute(
+            update(ActivityRecord).where(ActivityRecord.id == "B").values(predecessors="A,A")
+        )
+
+    _init(tmp_path)     # re-opening runs the CSV → link table migration
+    assert db.load_all_activities()["B"].predecessors == ("A",)
@@ -0,0 +1,154 @@
+"""Tests for the CPM engine in scheduler.py."""
+
+import copy
+import random
+
+import pytest
+
+import cpm_kernels
+import scheduler
+from activity import Activity
+from scheduler import CPMScheduler, SchedulerError
+
+_CPM_FIELDS = ("ES", "EF", "LS", "LF", "total_float", "free_float", "is_critical")
+
+
+@pytest.fixture(autouse=True)
+def _no_memo(monkeypatch):
+    """Each test starts without a memoised result from an earlier one."""
+    monkeypatch.setattr(scheduler, "_last_result", None)
+
+
+def _random_network(rng, n):
+    return {
+        f"A{i}": Activity(
+            f"A{i}", "x", rng.randint(0, 6),
+            tuple(f"A{j}" for j in rng.sample(range(i), min(i, rng.randint(0, 3)))),
+        )
+        for i in range(n)
+    }
+
+
+def _reference(activities):
+    """Full schedule of private copies, bypassing the memo; returns (fields, critical)."""
+    scheduler._last_result = None
+    acts = {k: copy.copy(a) for k, a in activities.items()}
+    sched = CPMScheduler(acts)
+    sched.schedule()
+    scheduler._last_result = None
+    fields = {k: tuple(getattr(a, f) for f in _CPM_FIELDS) for k, a in acts.items()}
+    return fields, sched.get_critical_path()
+
+
+def _fields(activities):
+    return {k: tuple(getattr(a, f) for f in _CPM_FIELDS) for k, a in activities.items()}
+
+
+def test_incremental_matches_full_reschedule():
+    rng = random.Random(1)
+    for _ in range(100):
+        acts = _random_network(rng, rng.randint(1, 60))
+        sched = CPMScheduler(acts)
+        sched.schedule()
+        for _ in range(3):
+            changed = rng.sample(list(acts), rng.randint(1, min(3, len(acts))))
+            for act_id in changed:
+                acts[act_id].duration = rng.randint(0, 9)
+            sched.schedule_incremental(changed)
+
+            fields, critical = _reference(acts)
+            assert _fields(acts) == fields
+            assert sched.get_critical_path() == critical
+            assert sched.project_duration() == max(f[1] for f in fields.values())
+
+
+def test_incremental_after_project_duration_only():
+    acts = {
+        "A": Activity("A", "a", 3),
+        "B": Activity("B", "b", 2, ("A",)),
+        "E": Activity("E", "e", 1),
+    }
+    sched = CPMScheduler(acts)
+    assert sched.project_duration() == 5
+
+    acts["E"].duration = 2
+    sched.schedule_incremental(["E"])
+
+    fields, critical = _reference(acts)
+    assert _fields(acts) == fields
+    assert sched.get_critical_path() == critical == ["A", "B"]
+
+
+def test_incremental_after_failed_schedule():
+    acts = {
+        "A": Activity("A", "a", 1, ("B",)),
+        "B": Activity("B", "b", 1, ("A",)),
+    }
+    sched = CPMScheduler(acts)
+    with pytest.raises(SchedulerError):
+        sched.schedule()
+    with pytest.raises(SchedulerError):
+        sched.schedule_incremental(["A"])
+
+
+def _baseline_cpm(activities):
+    """Straightforward dict-based CPM, independent of the array engine."""
+    order, done = [], set()
+    while len(order) < len(activities):
+        for act_id, act in activities.items():
+            if act_id not in done and all(p in done for p in act.predecessors):
+                order.append(act_id)
+                done.add(act_id)
+    succs = {k: [] for k in activities}
+    for act_id, act in activities.items():
+        for p in act.predecessors:
+            succs[p].append(act_id)
+
+    es, ef, ls, lf = {}, {}, {}, {}
+    for k in order:
+        es[k] = max((ef[p] for p in activities[k].predecessors), default=0)
+        ef[k] = es[k] + activities[k].duration
+    finish = max(ef.values())
+    for k in reversed(order):
+        lf[k] = min((ls[s] for s in succs[k]), default=finish)
+        ls[k] = lf[k] - activities[k].duration
+    fields = {
+        k: (
+            es[k], ef[k], ls[k], lf[k], ls[k] - es[k],
+            min((es[s] for s in succs[k]), default=finish) - ef[k],
+            ls[k] == es[k],
+        )
+        for k in activities
+    }
+    return fields, [k for k in activities if fields[k][6]]
+
+
+@pytest.mark.parametrize("numba, min_width", [
+    pytest.param(True, scheduler._LEVEL_SYNC_MIN_WIDTH, id="numba",
+                 marks=pytest.mark.skipif(not cpm_kernels.HAVE_NUMBA,
+                                          reason="Numba not installed")),
+    pytest.param(False, 0, id="level-sync"),
+    pytest.param(False, 10**9, id="scalar"),
+])
+def test_execution_paths_match_baseline(monkeypatch, numba, min_width):
+    monkeypatch.setattr(cpm_kernels, "HAVE_NUMBA", numba)
+    monkeypatch.setattr(scheduler, "_LEVEL_SYNC_MIN_WIDTH", min_width)
+    rng = random.Random(7)
+    for _ in range(60):
+        acts = _random_network(rng, rng.randint(1, 120))
+        fields, critical = _baseline_cpm(acts)
+        sched = CPMScheduler(acts)
+        sched.schedule()
+        assert _fields(acts) == fields
+        assert sched.get_critical_path() == critical
+        assert sched.project_duration() == max(f[1] for f in fields.values())
+
+        # A second scheduler on the same network is served from the memo
+        copies = {k: copy.copy(a) for k, a in acts.items()}
+        for a in copies.values():
+            a.ES = a.EF = a.LS = a.LF = a.total_float = a.free_float = 0
+            a.is_critical = False
+        memo = CPMScheduler(copies)
+        memo.schedule()
+        assert _fields(copies) == fields
+        assert memo.get_critical_path() == critical